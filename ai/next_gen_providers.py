@@ -16,6 +16,7 @@ from datetime import datetime
 
 # AI Provider imports
 import openai
+import httpx  # Installed with the openai and anthropic SDKs
 try:
     import anthropic
 except ImportError:
@@ -38,6 +39,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Connection pool bounds for each provider's HTTP client. Every provider talks
+# to a single API host, so the pool size is effectively a per-host limit.
+_POOL_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=30.0)
+
 
 class AIProvider(Enum):
     """Supported AI providers"""
@@ -122,7 +127,10 @@ class OpenAIProvider(BaseAIProvider):
     def __init__(self, api_key: str = None):
         super().__init__(api_key or os.getenv('OPENAI_API_KEY'))
         if self.is_available:
-            self.client = openai.AsyncOpenAI(api_key=self.api_key)
+            self.client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=openai.DefaultAsyncHttpxClient(limits=_POOL_LIMITS)
+            )
     
     def _check_availability(self) -> bool:
         return bool(self.api_key and openai)
@@ -242,7 +250,10 @@ class AnthropicProvider(BaseAIProvider):
     def __init__(self, api_key: str = None):
         super().__init__(api_key or os.getenv('ANTHROPIC_API_KEY'))
         if self.is_available and anthropic:
-            self.client = anthropic.AsyncAnthropic(api_key=self.api_key)
+            self.client = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                http_client=anthropic.DefaultAsyncHttpxClient(limits=_POOL_LIMITS)
+            )
     
     def _check_availability(self) -> bool:
         return bool(self.api_key and anthropic)
@@ -450,5 +461,6 @@ class NextGenAIOrchestrator:
         return stats
 
 
-# Global orchestrator instance
+# Global orchestrator instance; providers (and their connection pools) live for
+# the whole process, so import this rather than constructing new orchestrators
 ai_orchestrator = NextGenAIOrchestrator()
@@ -7,6 +7,7 @@ Multi-platform posting, engagement automation, and growth optimization
 import asyncio
 import json
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Any, Tuple
@@ -449,6 +450,7 @@ class SocialMediaScheduler:
     def __init__(self):
         self.accounts = {}
         self.scheduled_posts = {}
+        self._posts_by_platform = defaultdict(dict)
         self.engagement_tasks = {}
         self.api_clients = {
             Platform.INSTAGRAM: InstagramAPI,
@@ -471,6 +473,7 @@ class SocialMediaScheduler:
             post.created_time = datetime.now()
         
         self.scheduled_posts[post.post_id] = post
+        self._posts_by_platform[post.platform][post.post_id] = post
         
         logger.info(f"Scheduled {post.content_type.value} post for {post.platform.value} at {post.scheduled_time}")
         
@@ -626,10 +629,10 @@ class SocialMediaScheduler:
     def get_scheduled_posts(self, platform: Optional[Platform] = None) -> List[ScheduledPost]:
         """Get all scheduled posts, optionally filtered by platform"""
         
-        posts = list(self.scheduled_posts.values())
-        
         if platform:
-            posts = [post for post in posts if post.platform == platform]
+            posts = self._posts_by_platform[platform].values()
+        else:
+            posts = self.scheduled_posts.values()
         
         return sorted(posts, key=lambda x: x.scheduled_time)
     
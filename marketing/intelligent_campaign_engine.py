@@ -14,12 +14,22 @@ from enum import Enum
 import uuid
 import random
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ai.next_gen_providers import ai_orchestrator, AIRequest, ContentType
 from ai.viral_content_engine import viral_engine, ViralContentRequest, PlatformOptimization
 
 logger = logging.getLogger(__name__)
 
 
+def _as_datetime(value) -> datetime:
+    """Accept campaign brief dates as datetimes or ISO strings"""
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
 class CampaignType(Enum):
     """Types of marketing campaigns"""
     PRODUCT_LAUNCH = "product_launch"
@@ -275,7 +285,7 @@ Format as JSON with: topic, hook, key_points, visual_suggestions"""
         try:
             response = await ai_orchestrator.generate_content(ai_request)
             # Parse JSON response
-            content_idea = json.loads(response.content)
+            content_idea = orjson.loads(response.content) if orjson is not None else json.loads(response.content)
             return content_idea
         except:
             # Fallback content idea
@@ -525,8 +535,8 @@ class IntelligentCampaignEngine:
             objective=CampaignObjective(**campaign_brief["objective"]),
             target_audience=TargetAudience(**campaign_brief["target_audience"]),
             content_strategy=ContentStrategy(**campaign_brief["content_strategy"]),
-            start_date=datetime.fromisoformat(campaign_brief["start_date"]),
-            end_date=datetime.fromisoformat(campaign_brief["end_date"]),
+            start_date=_as_datetime(campaign_brief["start_date"]),
+            end_date=_as_datetime(campaign_brief["end_date"]),
             created_date=datetime.now(),
             platforms=campaign_brief["platforms"],
             total_budget=campaign_brief["total_budget"],
@@ -589,13 +599,14 @@ class IntelligentCampaignEngine:
         
         campaign.creative_assets = creative_assets
         
+        launched_at = datetime.now()
         return {
             "campaign_id": campaign_id,
             "status": "launched",
-            "launch_date": datetime.now().isoformat(),
+            "launch_date": launched_at.isoformat(),
             "initial_content_generated": len(creative_assets),
             "estimated_reach": sum(asset["predicted_performance"]["reach"] for asset in creative_assets),
-            "next_optimization": (datetime.now() + timedelta(days=3)).isoformat()
+            "next_optimization": (launched_at + timedelta(days=3)).isoformat()
         }
     
     async def optimize_campaign(self, campaign_id: str, 
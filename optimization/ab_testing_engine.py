@@ -8,15 +8,20 @@ import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 import uuid
 import numpy as np
-import scipy.stats as stats
 from collections import defaultdict
+from functools import lru_cache
 import math
 
+from optimization._stats_fast import (
+    z_prop_pvalue, z_from_probability, t_two_sided_pvalue,
+    normal_two_sided_pvalues, t_two_sided_pvalues, obrien_fleming_pvalue_boundary
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,7 +64,7 @@ class MetricType(Enum):
     SHARE_RATE = "share_rate"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestVariant:
     """A/B test variant"""
     variant_id: str
@@ -70,16 +75,18 @@ class TestVariant:
     variant_data: Dict[str, Any]  # The actual variant content/settings
     traffic_allocation: float  # Percentage of traffic (0.0 to 1.0)
     
-    # Performance metrics
+    # Performance metrics; once the variant belongs to an ABTest these read and
+    # write that test's counter arrays (see _CounterView below)
     impressions: int = 0
     clicks: int = 0
     conversions: int = 0
     revenue: float = 0.0
     
-    # Calculated metrics
+    # Calculated metrics (refreshed by each analysis)
     engagement_rate: float = 0.0
     conversion_rate: float = 0.0
     revenue_per_visitor: float = 0.0
+    revenue_variance: float = 0.0  # Sample variance of revenue per visitor
     
     # Statistical data
     confidence_interval: Tuple[float, float] = (0.0, 0.0)
@@ -88,9 +95,55 @@ class TestVariant:
     # Status
     is_control: bool = False
     is_winner: bool = False
+    
+    # Owning test's 3 x V counter matrix, revenue array and this variant's column
+    _counters: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _rev: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _index: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def _bind(self, counters: np.ndarray, revenue: np.ndarray, index: int):
+        """Back the counter fields with an ABTest's arrays from now on"""
+        self._counters = counters
+        self._rev = revenue
+        self._index = index
 
 
-@dataclass
+class _CounterView:
+    """TestVariant counter that is a view into the owning ABTest's arrays
+    
+    Wraps the field's slot, which still holds the value until the variant is bound.
+    """
+    
+    __slots__ = ("_slot", "_row")
+    
+    def __init__(self, slot, row: Optional[int]):
+        self._slot = slot
+        self._row = row  # Row of ABTest._counters, or None for revenue
+    
+    def __get__(self, variant, owner=None):
+        if variant is None:
+            return self
+        if variant._counters is None:
+            return self._slot.__get__(variant, owner)
+        if self._row is None:
+            return float(variant._rev[variant._index])
+        return int(variant._counters[self._row, variant._index])
+    
+    def __set__(self, variant, value):
+        # __init__ assigns the counters before the later _counters field exists
+        if getattr(variant, "_counters", None) is None:
+            self._slot.__set__(variant, value)
+        elif self._row is None:
+            variant._rev[variant._index] = value
+        else:
+            variant._counters[self._row, variant._index] = value
+
+
+for _name, _row in (("impressions", 0), ("clicks", 1), ("conversions", 2), ("revenue", None)):
+    setattr(TestVariant, _name, _CounterView(getattr(TestVariant, _name), _row))
+
+
+@dataclass(slots=True)
 class ABTest:
     """A/B test configuration and results"""
     test_id: str
@@ -106,14 +159,16 @@ class ABTest:
     # Test parameters
     minimum_sample_size: int
     minimum_effect_size: float  # Minimum detectable effect
-    confidence_level: float = 0.95  # 95% confidence
-    statistical_power: float = 0.8  # 80% power
     
     # Test duration
     start_date: datetime
     end_date: datetime
     max_duration_days: int = 30
     
+    # Statistical parameters
+    confidence_level: float = 0.95  # 95% confidence
+    statistical_power: float = 0.8  # 80% power
+    
     # Test status
     status: TestStatus = TestStatus.DRAFT
     
@@ -126,23 +181,102 @@ class ABTest:
     created_by: str = "system"
     created_date: datetime = None
     last_updated: datetime = None
+    
+    # Live per-variant counters (structure-of-arrays, indexed like `variants`);
+    # _imp/_clk/_conv are row views into the 3 x V `_counters` matrix
+    variant_index: Dict[str, int] = field(init=False, repr=False)
+    control_index: int = field(init=False, repr=False)
+    _counters: np.ndarray = field(init=False, repr=False)
+    _imp: np.ndarray = field(init=False, repr=False)
+    _clk: np.ndarray = field(init=False, repr=False)
+    _conv: np.ndarray = field(init=False, repr=False)
+    _rev: np.ndarray = field(init=False, repr=False)
+    
+    # Welford accumulators over revenue-bearing events (count, running mean, M2)
+    _rev_n: np.ndarray = field(init=False, repr=False)
+    _rev_mean: np.ndarray = field(init=False, repr=False)
+    _rev_m2: np.ndarray = field(init=False, repr=False)
+    
+    # Running impression total across all variants
+    _total_impressions: int = field(default=0, init=False, repr=False)
+    
+    # Group-sequential stopping: nominal p-value threshold per planned look,
+    # and the next look (1-based) that has not been analyzed yet
+    _boundary: np.ndarray = field(init=False, repr=False)
+    _next_look: int = field(default=1, init=False, repr=False)
+    
+    # Event sequence number, and the one the cached results were computed at
+    _event_seq: int = field(default=0, init=False, repr=False)
+    _results_seq: int = field(default=-1, init=False, repr=False)
+    
+    def __post_init__(self):
+        self.variant_index = {v.variant_id: i for i, v in enumerate(self.variants)}
+        self.control_index = next((i for i, v in enumerate(self.variants) if v.is_control), 0)
+        self._counters = np.array([
+            [v.impressions for v in self.variants],
+            [v.clicks for v in self.variants],
+            [v.conversions for v in self.variants]
+        ], dtype=np.int64).reshape(3, len(self.variants))
+        self._imp, self._clk, self._conv = self._counters
+        self._total_impressions = int(self._imp.sum())
+        self._boundary = obrien_fleming_pvalue_boundary(_SEQUENTIAL_LOOKS, 1 - self.confidence_level)
+        self._rev = np.array([v.revenue for v in self.variants], dtype=np.float64)
+        self._rev_n = np.zeros(len(self.variants), dtype=np.int64)
+        self._rev_mean = np.zeros(len(self.variants), dtype=np.float64)
+        self._rev_m2 = np.zeros(len(self.variants), dtype=np.float64)
+        
+        for i, variant in enumerate(self.variants):
+            variant._bind(self._counters, self._rev, i)
+
+
+# Z-scores for the default 95% confidence / 80% power sample-size plan
+_Z_ALPHA_95 = 1.959963984540054
+_Z_BETA_80 = 0.8416212335729143
+
+# Interim analyses per test, evenly spaced over the minimum sample size
+_SEQUENTIAL_LOOKS = 10
+
+# Row of ABTest._counters incremented by each event type
+_EVENT_DISPATCH = {"impression": 0, "click": 1, "conversion": 2}
+_IMPRESSION_ROW = _EVENT_DISPATCH["impression"]
+_CONVERSION_ROW = _EVENT_DISPATCH["conversion"]
+
+def _copy_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of analysis results with fresh containers; the leaves are immutable scalars, strings and tuples"""
+    copied = dict(results)
+    copied["variants"] = [dict(variant_result) for variant_result in results["variants"]]
+    copied["statistical_analysis"] = {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in results["statistical_analysis"].items()
+    }
+    copied["recommendations"] = list(results["recommendations"])
+    return copied
+
+
+# Counter array holding the numerator of each rate metric (denominator is impressions)
+_METRIC_NUMERATORS = {
+    MetricType.CONVERSION_RATE: "_conv",
+    MetricType.REVENUE_PER_VISITOR: "_rev",
+    MetricType.ENGAGEMENT_RATE: "_clk",
+}
 
 
 class StatisticalAnalyzer:
     """Statistical analysis for A/B tests"""
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def calculate_sample_size(baseline_rate: float, minimum_effect_size: float,
                             confidence_level: float = 0.95, power: float = 0.8) -> int:
         """Calculate required sample size for A/B test"""
         
-        # Convert confidence level to alpha
-        alpha = 1 - confidence_level
-        beta = 1 - power
-        
-        # Z-scores
-        z_alpha = stats.norm.ppf(1 - alpha/2)
-        z_beta = stats.norm.ppf(power)
+        # Z-scores (constants for the default plan)
+        if confidence_level == 0.95 and power == 0.8:
+            z_alpha, z_beta = _Z_ALPHA_95, _Z_BETA_80
+        else:
+            alpha = 1 - confidence_level
+            z_alpha = z_from_probability(1 - alpha/2)
+            z_beta = z_from_probability(power)
         
         # Effect size calculation
         p1 = baseline_rate
@@ -168,60 +302,124 @@ class StatisticalAnalyzer:
         
         if metric == MetricType.CONVERSION_RATE:
             # Proportion test
-            n1, n2 = variant_a.impressions, variant_b.impressions
-            x1, x2 = variant_a.conversions, variant_b.conversions
-            
-            if n1 == 0 or n2 == 0:
-                return 0.0, False
-            
-            p1, p2 = x1/n1, x2/n2
-            p_pooled = (x1 + x2) / (n1 + n2)
-            
-            se = math.sqrt(p_pooled * (1 - p_pooled) * (1/n1 + 1/n2))
-            
-            if se == 0:
-                return 0.0, False
+            p_value = z_prop_pvalue(
+                variant_a.impressions, variant_a.conversions,
+                variant_b.impressions, variant_b.conversions
+            )
             
-            z_score = (p2 - p1) / se
-            p_value = 2 * (1 - stats.norm.cdf(abs(z_score)))
+            if p_value < 0:
+                return 1.0, False  # No impressions or zero variance
             
             return p_value, p_value < 0.05
         
         elif metric == MetricType.REVENUE_PER_VISITOR:
-            # T-test for continuous variables
+            # Welch's t-test for continuous variables
             if variant_a.impressions < 30 or variant_b.impressions < 30:
                 return 1.0, False  # Not enough data
             
-            # Simplified t-test (would need actual revenue data points)
             mean1 = variant_a.revenue_per_visitor
             mean2 = variant_b.revenue_per_visitor
-            
-            # Estimate standard deviations (simplified)
-            std1 = mean1 * 0.5  # Assume 50% coefficient of variation
-            std2 = mean2 * 0.5
-            
             n1, n2 = variant_a.impressions, variant_b.impressions
             
-            se = math.sqrt((std1**2 / n1) + (std2**2 / n2))
+            # Squared standard errors from the tracked sample variances
+            se1_sq = variant_a.revenue_variance / n1
+            se2_sq = variant_b.revenue_variance / n2
+            se = math.sqrt(se1_sq + se2_sq)
             
             if se == 0:
-                return 0.0, False
+                return 1.0, False  # Zero variance
             
             t_score = (mean2 - mean1) / se
-            df = n1 + n2 - 2
-            p_value = 2 * (1 - stats.t.cdf(abs(t_score), df))
+            # Welch-Satterthwaite degrees of freedom
+            df = (se1_sq + se2_sq) ** 2 / (se1_sq ** 2 / (n1 - 1) + se2_sq ** 2 / (n2 - 1))
+            p_value = t_two_sided_pvalue(t_score, df)
             
             return p_value, p_value < 0.05
         
         return 1.0, False
     
+    @staticmethod
+    def calculate_significance_vs_control(impressions: np.ndarray, conversions: np.ndarray,
+                                          metrics: Dict[str, np.ndarray], control_index: int,
+                                          metric: MetricType) -> np.ndarray:
+        """Two-sided p-values of every variant against the control (array version)"""
+        
+        n_c = impressions[control_index]
+        p_values = np.ones(impressions.size, dtype=np.float64)
+        
+        if metric == MetricType.CONVERSION_RATE:
+            # Pooled two-proportion z-test
+            x_c = conversions[control_index]
+            rates = metrics["conversion_rate"]
+            
+            p_pooled = (x_c + conversions) / np.maximum(n_c + impressions, 1)
+            se = np.sqrt(p_pooled * (1 - p_pooled) * (1 / max(n_c, 1) + 1 / np.maximum(impressions, 1)))
+            
+            valid = (se > 0) & (impressions > 0) & (n_c > 0)
+            z_scores = np.divide(rates - rates[control_index], se, out=np.zeros_like(se), where=valid)
+            
+            p_values = np.where(valid, normal_two_sided_pvalues(z_scores), 1.0)
+        
+        elif metric == MetricType.REVENUE_PER_VISITOR:
+            # Welch's t-test
+            if n_c < 30:
+                return p_values  # Not enough data
+            
+            means = metrics["revenue_per_visitor"]
+            se_sq = metrics["revenue_variance"] / np.maximum(impressions, 1)
+            se_c_sq = se_sq[control_index]
+            se = np.sqrt(se_c_sq + se_sq)
+            
+            enough = impressions >= 30
+            valid = enough & (se > 0)
+            t_scores = np.divide(means - means[control_index], se, out=np.zeros_like(se), where=valid)
+            
+            # Welch-Satterthwaite degrees of freedom
+            df_denominator = se_c_sq ** 2 / (n_c - 1) + se_sq ** 2 / np.maximum(impressions - 1, 1)
+            df = np.divide((se_c_sq + se_sq) ** 2, df_denominator,
+                           out=np.ones_like(se), where=df_denominator > 0)
+            
+            p_values = np.where(valid, t_two_sided_pvalues(t_scores, df), 1.0)
+        
+        return p_values
+    
+    @staticmethod
+    def calculate_confidence_intervals(impressions: np.ndarray, metrics: Dict[str, np.ndarray],
+                                       metric: MetricType,
+                                       confidence_level: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+        """Confidence interval bounds for every variant (array version)"""
+        
+        alpha = 1 - confidence_level
+        z_score = z_from_probability(1 - alpha/2)
+        n = np.maximum(impressions, 1)
+        has_data = impressions > 0
+        
+        if metric == MetricType.CONVERSION_RATE:
+            p = metrics["conversion_rate"]
+            margin_error = z_score * np.sqrt(p * (1 - p) / n)
+            
+            lower = np.where(has_data, np.maximum(0, p - margin_error), 0.0)
+            upper = np.where(has_data, np.minimum(1, p + margin_error), 0.0)
+            return lower, upper
+        
+        elif metric == MetricType.REVENUE_PER_VISITOR:
+            mean = metrics["revenue_per_visitor"]
+            margin_error = z_score * np.sqrt(metrics["revenue_variance"] / n)
+            
+            lower = np.where(has_data, np.maximum(0, mean - margin_error), 0.0)
+            upper = np.where(has_data, mean + margin_error, 0.0)
+            return lower, upper
+        
+        zeros = np.zeros(impressions.size, dtype=np.float64)
+        return zeros, zeros.copy()
+    
     @staticmethod
     def calculate_confidence_interval(variant: TestVariant, metric: MetricType,
                                     confidence_level: float = 0.95) -> Tuple[float, float]:
         """Calculate confidence interval for variant metric"""
         
         alpha = 1 - confidence_level
-        z_score = stats.norm.ppf(1 - alpha/2)
+        z_score = z_from_probability(1 - alpha/2)
         
         if metric == MetricType.CONVERSION_RATE:
             if variant.impressions == 0:
@@ -240,8 +438,7 @@ class StatisticalAnalyzer:
                 return (0.0, 0.0)
             
             mean = variant.revenue_per_visitor
-            # Simplified standard error calculation
-            se = mean * 0.1  # Assume 10% standard error
+            se = math.sqrt(variant.revenue_variance / variant.impressions)
             margin_error = z_score * se
             
             return (max(0, mean - margin_error), mean + margin_error)
@@ -256,6 +453,7 @@ class ABTestEngine:
         self.active_tests = {}
         self.completed_tests = {}
         self.test_results_cache = {}
+        self._active_snapshot: Optional[Tuple[ABTest, ...]] = None  # Invalidated on add/remove
         self.analyzer = StatisticalAnalyzer()
     
     async def create_test(self, test_config: Dict[str, Any]) -> ABTest:
@@ -304,6 +502,7 @@ class ABTestEngine:
         )
         
         self.active_tests[test_id] = test
+        self._active_snapshot = None
         
         logger.info(f"Created A/B test: {test.name} ({test_id})")
         
@@ -332,9 +531,9 @@ class ABTestEngine:
         
         return True
     
-    async def record_event(self, test_id: str, variant_id: str, 
-                          event_type: str, event_data: Dict[str, Any] = None):
-        """Record event for A/B test variant"""
+    def record_event(self, test_id: str, variant_id: str,
+                     event_type: str, event_data: Dict[str, Any] = None):
+        """Record event for A/B test variant (synchronous - pure in-memory bookkeeping)"""
         
         if test_id not in self.active_tests:
             return  # Test not found or not active
@@ -345,30 +544,129 @@ class ABTestEngine:
             return  # Test not running
         
         # Find variant
-        variant = None
-        for v in test.variants:
-            if v.variant_id == variant_id:
-                variant = v
-                break
+        idx = test.variant_index.get(variant_id)
         
-        if not variant:
+        if idx is None:
             return  # Variant not found
         
+        row = _EVENT_DISPATCH.get(event_type)
+        
+        if row is None:
+            return  # Unknown event type
+        
         # Record event
-        if event_type == "impression":
-            variant.impressions += 1
-        elif event_type == "click":
-            variant.clicks += 1
-        elif event_type == "conversion":
-            variant.conversions += 1
-            if event_data and "revenue" in event_data:
-                variant.revenue += event_data["revenue"]
-        
-        # Update calculated metrics
-        self._update_variant_metrics(variant)
+        test._event_seq += 1
+        test._counters[row, idx] += 1
+        
+        if row == _IMPRESSION_ROW:
+            test._total_impressions += 1
+        elif row == _CONVERSION_ROW and event_data and "revenue" in event_data:
+            revenue = event_data["revenue"]
+            test._rev[idx] += revenue
+            
+            # Welford update of the revenue sample mean/M2
+            test._rev_n[idx] += 1
+            delta = revenue - test._rev_mean[idx]
+            test._rev_mean[idx] += delta / test._rev_n[idx]
+            test._rev_m2[idx] += delta * (revenue - test._rev_mean[idx])
+        
+        # Check if test should be stopped
+        self._check_test_completion(test)
+    
+    def record_events(self, test_id: str, variant_indices: np.ndarray, event_codes: np.ndarray,
+                      revenue: Optional[np.ndarray] = None):
+        """Record a batch of events for an A/B test in a few array operations
+        
+        variant_indices index into test.variants, event_codes use the rows of
+        _EVENT_DISPATCH (0 = impression, 1 = click, 2 = conversion) and revenue
+        holds the amount for conversion events (NaN or ignored for the rest).
+        Raises ValueError if the arrays differ in length or hold an index or
+        code out of range; nothing is recorded in that case.
+        """
+        
+        if test_id not in self.active_tests:
+            return  # Test not found or not active
+        
+        test = self.active_tests[test_id]
+        
+        if test.status != TestStatus.RUNNING:
+            return  # Test not running
+        
+        variant_indices = np.asarray(variant_indices, dtype=np.intp)
+        event_codes = np.asarray(event_codes, dtype=np.intp)
+        
+        if variant_indices.shape != event_codes.shape or variant_indices.ndim != 1:
+            raise ValueError("variant_indices and event_codes must be 1-D arrays of the same length")
+        
+        if variant_indices.size == 0:
+            return
+        
+        # np.add.at would wrap negative indices onto other variants, so check the ranges first
+        if variant_indices.min() < 0 or variant_indices.max() >= len(test.variants):
+            raise ValueError(f"variant_indices must be in [0, {len(test.variants)})")
+        if event_codes.min() < 0 or event_codes.max() >= len(_EVENT_DISPATCH):
+            raise ValueError(f"event_codes must be in [0, {len(_EVENT_DISPATCH)})")
+        
+        if revenue is not None:
+            revenue = np.asarray(revenue, dtype=np.float64)
+            if revenue.shape != event_codes.shape:
+                raise ValueError("revenue must have the same length as event_codes")
+        
+        # Record events
+        np.add.at(test._counters, (event_codes, variant_indices), 1)
+        test._event_seq += int(variant_indices.size)
+        test._total_impressions += int(np.count_nonzero(event_codes == _IMPRESSION_ROW))
+        
+        if revenue is not None:
+            has_revenue = (event_codes == _CONVERSION_ROW) & ~np.isnan(revenue)
+            
+            if has_revenue.any():
+                self._merge_revenue_batch(test, variant_indices[has_revenue], revenue[has_revenue])
         
         # Check if test should be stopped
-        await self._check_test_completion(test)
+        self._check_test_completion(test)
+    
+    def record_event_pairs(self, test_id: str, events: List[Tuple[str, str]]):
+        """Record a batch of (variant_id, event_type) events through record_events
+        
+        Unknown variants and event types are skipped, as in record_event.
+        """
+        
+        test = self.active_tests.get(test_id)
+        
+        if test is None:
+            return  # Test not found or not active
+        
+        pairs = [
+            (test.variant_index.get(variant_id), _EVENT_DISPATCH.get(event_type))
+            for variant_id, event_type in events
+        ]
+        pairs = [(idx, row) for idx, row in pairs if idx is not None and row is not None]
+        
+        if not pairs:
+            return
+        
+        variant_indices, event_codes = zip(*pairs)
+        self.record_events(test_id, np.array(variant_indices), np.array(event_codes))
+    
+    def _merge_revenue_batch(self, test: ABTest, variant_indices: np.ndarray, revenue: np.ndarray):
+        """Fold a batch of revenue samples into the per-variant Welford state (Chan et al.)"""
+        
+        size = len(test.variants)
+        batch_n = np.bincount(variant_indices, minlength=size)
+        batch_sum = np.bincount(variant_indices, weights=revenue, minlength=size)
+        batch_mean = batch_sum / np.maximum(batch_n, 1)
+        batch_m2 = np.bincount(variant_indices, weights=(revenue - batch_mean[variant_indices]) ** 2,
+                               minlength=size)
+        
+        total_n = test._rev_n + batch_n
+        delta = batch_mean - test._rev_mean
+        weight = np.divide(batch_n, total_n, out=np.zeros(size), where=total_n > 0)
+        
+        test._rev += batch_sum
+        test._rev_m2 += batch_m2 + delta ** 2 * test._rev_n * weight
+        test._rev_mean += delta * weight
+        test._rev_n[:] = total_n
     
     async def analyze_test_results(self, test_id: str) -> Dict[str, Any]:
         """Analyze A/B test results"""
@@ -378,12 +676,33 @@ class ABTestEngine:
         
         test = self.active_tests.get(test_id) or self.completed_tests.get(test_id)
         
+        # Callers get their own containers; the cached results stay untouched
+        return _copy_results(self._compute_test_results(test))
+    
+    def _compute_test_results(self, test: ABTest) -> Dict[str, Any]:
+        """Run the statistical analysis for a test and cache the results
+        
+        Returns the cached dict itself; copy it with _copy_results before handing it out.
+        """
+        
+        test_id = test.test_id
+        
+        # Nothing recorded since the last analysis - only the status can have moved
+        if test._results_seq == test._event_seq:
+            test.test_results["status"] = test.status.value
+            return test.test_results
+        
         # Update all variant metrics
-        for variant in test.variants:
-            self._update_variant_metrics(variant)
+        metrics = self._update_variant_metrics(test)
+        
+        # Statistical analysis, vectorized across variants
+        lower, upper = self.analyzer.calculate_confidence_intervals(
+            test._imp, metrics, test.primary_metric
+        )
+        p_values = self.analyzer.calculate_significance_vs_control(
+            test._imp, test._conv, metrics, test.control_index, test.primary_metric
+        )
         
-        # Statistical analysis
-        control_variant = next((v for v in test.variants if v.is_control), test.variants[0])
         results = {
             "test_id": test_id,
             "test_name": test.name,
@@ -394,20 +713,16 @@ class ABTestEngine:
             "recommendations": []
         }
         
-        # Analyze each variant
-        for variant in test.variants:
-            # Calculate confidence interval
-            ci = self.analyzer.calculate_confidence_interval(variant, test.primary_metric)
+        # Per-variant results
+        rows = zip(test.variants, lower.tolist(), upper.tolist(), p_values.tolist())
+        for i, (variant, ci_lower, ci_upper, p_value) in enumerate(rows):
+            ci = (ci_lower, ci_upper)
             variant.confidence_interval = ci
             
-            # Calculate statistical significance vs control
-            if variant != control_variant:
-                p_value, is_significant = self.analyzer.calculate_statistical_significance(
-                    control_variant, variant, test.primary_metric
-                )
+            if i != test.control_index:
                 variant.statistical_significance = 1 - p_value
             
-            variant_result = {
+            results["variants"].append({
                 "variant_id": variant.variant_id,
                 "name": variant.name,
                 "is_control": variant.is_control,
@@ -419,19 +734,20 @@ class ABTestEngine:
                 "confidence_interval": ci,
                 "statistical_significance": variant.statistical_significance,
                 "is_winner": variant.is_winner
-            }
-            
-            results["variants"].append(variant_result)
+            })
         
         # Determine winner
-        winner = self._determine_winner(test)
-        if winner:
+        ranking = self._rank_variants(test)
+        if ranking:
+            winner_idx, improvement = ranking
+            winner = test.variants[winner_idx]
             winner.is_winner = True
             test.winning_variant_id = winner.variant_id
             results["winner"] = winner.variant_id
+            results["statistical_analysis"]["improvement_over_control"] = improvement.tolist()
         
         # Generate recommendations
-        recommendations = self._generate_recommendations(test)
+        recommendations = self._generate_recommendations(test, ranking)
         results["recommendations"] = recommendations
         test.recommendations = recommendations
         
@@ -439,6 +755,7 @@ class ABTestEngine:
         self.test_results_cache[test_id] = results
         test.test_results = results
         test.last_updated = datetime.now()
+        test._results_seq = test._event_seq
         
         return results
     
@@ -453,20 +770,26 @@ class ABTestEngine:
         if test.status != TestStatus.RUNNING:
             raise ValueError(f"Test is not running. Current status: {test.status}")
         
+        self._finalize_test(test, reason)
+        
+        return True
+    
+    def _finalize_test(self, test: ABTest, reason: str):
+        """Complete a running test, analyze final results and archive it"""
+        
         test.status = TestStatus.COMPLETED
         test.end_date = datetime.now()
         test.last_updated = datetime.now()
         
         # Analyze final results
-        await self.analyze_test_results(test_id)
+        self._compute_test_results(test)
         
         # Move to completed tests
-        self.completed_tests[test_id] = test
-        del self.active_tests[test_id]
+        self.completed_tests[test.test_id] = test
+        del self.active_tests[test.test_id]
+        self._active_snapshot = None
         
         logger.info(f"Stopped A/B test: {test.name} (Reason: {reason})")
-        
-        return True
     
     def _validate_test_config(self, test: ABTest) -> bool:
         """Validate A/B test configuration"""
@@ -486,69 +809,98 @@ class ABTestEngine:
         
         return True
     
-    def _update_variant_metrics(self, variant: TestVariant):
-        """Update calculated metrics for variant"""
+    def _update_variant_metrics(self, test: ABTest) -> Dict[str, np.ndarray]:
+        """Refresh the variants' calculated metrics from the counter arrays; returns the metric arrays"""
+        
+        denominator = np.maximum(test._imp, 1)
+        
+        # Per-visitor revenue variance: merge the Welford stats of revenue-bearing
+        # events with the zero-revenue remainder of impressions (Chan et al.)
+        zero_count = np.maximum(test._imp - test._rev_n, 0)
+        m2 = test._rev_m2 + test._rev_mean ** 2 * test._rev_n * zero_count / denominator
+        metrics = {
+            "engagement_rate": test._clk / denominator,
+            "conversion_rate": test._conv / denominator,
+            "revenue_per_visitor": test._rev / denominator,
+            "revenue_variance": m2 / np.maximum(test._imp - 1, 1)
+        }
+        
+        rows = zip(
+            test.variants,
+            metrics["engagement_rate"].tolist(),
+            metrics["conversion_rate"].tolist(),
+            metrics["revenue_per_visitor"].tolist(),
+            metrics["revenue_variance"].tolist()
+        )
+        
+        for variant, engagement, conversion, rpv, rev_var in rows:
+            variant.engagement_rate = engagement
+            variant.conversion_rate = conversion
+            variant.revenue_per_visitor = rpv
+            variant.revenue_variance = rev_var
         
-        if variant.impressions > 0:
-            variant.engagement_rate = variant.clicks / variant.impressions
-            variant.conversion_rate = variant.conversions / variant.impressions
-            variant.revenue_per_visitor = variant.revenue / variant.impressions
+        return metrics
     
-    async def _check_test_completion(self, test: ABTest):
-        """Check if test should be completed"""
+    def _metric_values(self, test: ABTest, metric: MetricType) -> Optional[np.ndarray]:
+        """Per-variant values of a rate metric, computed from the counter arrays"""
         
-        # Check if minimum sample size reached
-        total_impressions = sum(v.impressions for v in test.variants)
-        if total_impressions < test.minimum_sample_size:
+        numerator_attr = _METRIC_NUMERATORS.get(metric)
+        if numerator_attr is None:
+            return None
+        
+        return getattr(test, numerator_attr) / np.maximum(test._imp, 1)
+    
+    def _check_test_completion(self, test: ABTest):
+        """Check if test should be completed (group-sequential O'Brien-Fleming design)"""
+        
+        # Planned looks reached so far, by information fraction of the minimum sample
+        looks = test._boundary.size
+        look = min(test._total_impressions * looks // test.minimum_sample_size, looks)
+        
+        # Check if maximum duration reached once the planned sample is in
+        if look == looks and datetime.now() >= test.end_date:
+            self._finalize_test(test, "max_duration_reached")
             return
         
-        # Check if maximum duration reached
-        if datetime.now() >= test.end_date:
-            await self.stop_test(test.test_id, "max_duration_reached")
+        # Interim analyses only run when a new look is reached
+        if look < test._next_look:
             return
+        test._next_look = look + 1
         
-        # Check for early stopping due to statistical significance
-        control_variant = next((v for v in test.variants if v.is_control), test.variants[0])
+        # Early stopping when any variant crosses this look's boundary
+        metrics = self._update_variant_metrics(test)
+        p_values = self.analyzer.calculate_significance_vs_control(
+            test._imp, test._conv, metrics, test.control_index, test.primary_metric
+        )
         
-        for variant in test.variants:
-            if variant == control_variant:
-                continue
-            
-            p_value, is_significant = self.analyzer.calculate_statistical_significance(
-                control_variant, variant, test.primary_metric
-            )
-            
-            # Early stopping if highly significant and sufficient sample size
-            if is_significant and p_value < 0.01 and total_impressions > test.minimum_sample_size * 0.5:
-                await self.stop_test(test.test_id, "early_stopping_significance")
-                return
+        if (p_values < test._boundary[look - 1]).any():
+            self._finalize_test(test, "early_stopping_significance")
     
-    def _determine_winner(self, test: ABTest) -> Optional[TestVariant]:
-        """Determine winning variant"""
+    def _rank_variants(self, test: ABTest) -> Optional[Tuple[int, np.ndarray]]:
+        """Winner index and per-variant % improvement over control on the primary metric"""
+        
+        values = self._metric_values(test, test.primary_metric)
+        if values is None:
+            return None
         
-        if test.primary_metric == MetricType.CONVERSION_RATE:
-            return max(test.variants, key=lambda v: v.conversion_rate)
-        elif test.primary_metric == MetricType.REVENUE_PER_VISITOR:
-            return max(test.variants, key=lambda v: v.revenue_per_visitor)
-        elif test.primary_metric == MetricType.ENGAGEMENT_RATE:
-            return max(test.variants, key=lambda v: v.engagement_rate)
+        baseline = values[test.control_index]
+        if baseline > 0:
+            improvement = (values - baseline) / baseline * 100.0
+        else:
+            improvement = np.zeros_like(values)
         
-        return None
+        return int(np.argmax(values)), improvement
     
-    def _generate_recommendations(self, test: ABTest) -> List[str]:
+    def _generate_recommendations(self, test: ABTest,
+                                  ranking: Optional[Tuple[int, np.ndarray]]) -> List[str]:
         """Generate recommendations based on test results"""
         
         recommendations = []
         
-        winner = self._determine_winner(test)
-        control = next((v for v in test.variants if v.is_control), test.variants[0])
-        
-        if winner and winner != control:
-            improvement = 0
-            if test.primary_metric == MetricType.CONVERSION_RATE:
-                improvement = ((winner.conversion_rate - control.conversion_rate) / control.conversion_rate) * 100
-            elif test.primary_metric == MetricType.REVENUE_PER_VISITOR:
-                improvement = ((winner.revenue_per_visitor - control.revenue_per_visitor) / control.revenue_per_visitor) * 100
+        if ranking and ranking[0] != test.control_index:
+            winner_idx, improvement_by_variant = ranking
+            winner = test.variants[winner_idx]
+            improvement = improvement_by_variant[winner_idx]
             
             recommendations.append(f"Implement {winner.name} - shows {improvement:.1f}% improvement over control")
             recommendations.append(f"Expected impact: {improvement:.1f}% increase in {test.primary_metric.value}")
@@ -556,19 +908,22 @@ class ABTestEngine:
             recommendations.append("No significant winner found - consider running longer or testing different variants")
         
         # Sample size recommendations
-        total_impressions = sum(v.impressions for v in test.variants)
+        total_impressions = test._total_impressions
         if total_impressions < test.minimum_sample_size:
             recommendations.append(f"Increase sample size - need {test.minimum_sample_size - total_impressions} more impressions")
         
         return recommendations
     
-    def get_active_tests(self) -> List[ABTest]:
-        """Get all active tests"""
-        return list(self.active_tests.values())
+    def get_active_tests(self) -> Tuple[ABTest, ...]:
+        """Get all active tests (an immutable snapshot, rebuilt when tests start or finish)"""
+        if self._active_snapshot is None:
+            self._active_snapshot = tuple(self.active_tests.values())
+        return self._active_snapshot
     
     def get_test_results(self, test_id: str) -> Optional[Dict[str, Any]]:
-        """Get cached test results"""
-        return self.test_results_cache.get(test_id)
+        """Get cached test results (a copy)"""
+        results = self.test_results_cache.get(test_id)
+        return _copy_results(results) if results is not None else None
 
 
 # Global A/B testing engine instance
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Opportunity-scoring kernels for the monetization engine
+Scalar kernels are pure arithmetic, JIT-compiled with Numba when it is installed;
+each has a NumPy array twin directly below it for batch scoring
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _jit(func):
+    """Compile with Numba in nopython mode when available, else run as plain Python"""
+    if njit is None:
+        return func
+    return njit(cache=True)(func)
+
+
+@_jit
+def sponsored_post_rate(followers: float, engagement_rate: float) -> float:
+    """Sponsored post rate: $0.01 per follower, boosted for engagement, capped at $10k"""
+    engagement_multiplier = max(1.0, engagement_rate * 20)
+    return min(followers * 0.01 * engagement_multiplier, 10000)
+
+
+def sponsored_post_rates(followers: np.ndarray, engagement_rate: np.ndarray) -> np.ndarray:
+    """Array form of sponsored_post_rate"""
+    return np.minimum(followers * 0.01 * np.maximum(1.0, engagement_rate * 20), 10000)
+
+
+@_jit
+def brand_partnership_value(followers: float, niche_multiplier: float) -> float:
+    """Monthly brand partnership value: $0.05 per follower, scaled by niche"""
+    return followers * 0.05 * niche_multiplier
+
+
+def brand_partnership_values(followers: np.ndarray, niche_multiplier: np.ndarray) -> np.ndarray:
+    """Array form of brand_partnership_value"""
+    return followers * 0.05 * niche_multiplier
+
+
+@_jit
+def course_price(base_price: float, niche_multiplier: float) -> float:
+    """Course price for an expertise-level base price, scaled by niche"""
+    return base_price * niche_multiplier
+
+
+def course_prices(base_price: np.ndarray, niche_multiplier: np.ndarray) -> np.ndarray:
+    """Array form of course_price"""
+    return base_price * niche_multiplier
+
+
+@_jit
+def course_enrollment(followers: float, engagement_rate: float) -> int:
+    """Course enrollment: 1% of engaged followers, at least 10 students"""
+    return max(int(followers * engagement_rate * 0.01), 10)
+
+
+def course_enrollments(followers: np.ndarray, engagement_rate: np.ndarray) -> np.ndarray:
+    """Array form of course_enrollment (truncates toward zero like int())"""
+    return np.maximum((followers * engagement_rate * 0.01).astype(np.int64), 10)
+
+
+@_jit
+def affiliate_potential(monthly_views: float, conversion_rate: float, avg_commission: float) -> float:
+    """Monthly affiliate revenue from views, conversion rate and commission"""
+    return monthly_views * conversion_rate * avg_commission
+
+
+def affiliate_potentials(monthly_views: np.ndarray, conversion_rate: np.ndarray,
+                         avg_commission: np.ndarray) -> np.ndarray:
+    """Array form of affiliate_potential"""
+    return monthly_views * conversion_rate * avg_commission
@@ -5,17 +5,31 @@ Intelligent revenue generation, optimization, and scaling for content creators
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import math
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, fields, replace, is_dataclass
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator
 from enum import Enum
-import uuid
+from types import MappingProxyType
+import secrets
 import random
 from decimal import Decimal
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ai.next_gen_providers import ai_orchestrator, AIRequest, ContentType
+from revenue import _scoring
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +75,7 @@ class AudienceSegment(Enum):
     ENTERPRISE_CLIENTS = "enterprise_clients"
 
 
-@dataclass
+@dataclass(slots=True)
 class RevenueOpportunity:
     """Revenue opportunity identification"""
     opportunity_id: str
@@ -70,7 +84,7 @@ class RevenueOpportunity:
     target_segment: AudienceSegment
     
     # Opportunity details
-    estimated_revenue: Decimal
+    estimated_revenue: float  # Estimates, not ledger values - kept as float
     implementation_effort: int  # 1-10 scale
     time_to_revenue: int  # days
     success_probability: float  # 0-1
@@ -82,15 +96,15 @@ class RevenueOpportunity:
     
     # Performance predictions
     conversion_rate: float
-    average_order_value: Decimal
-    customer_lifetime_value: Decimal
+    average_order_value: float
+    customer_lifetime_value: float
     
     # Implementation plan
     action_steps: List[str]
     success_metrics: Dict[str, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class MonetizationCampaign:
     """Monetization campaign"""
     campaign_id: str
@@ -120,90 +134,424 @@ class MonetizationCampaign:
     optimization_history: List[Dict[str, Any]]
 
 
+@dataclass(slots=True, frozen=True)
+class NormalizedProfile:
+    """Creator profile fields used for opportunity scoring, with defaults applied once"""
+    followers: int
+    engagement: float
+    niche: str
+    niche_code: int
+    expertise: str
+    monthly_views: int
+    platforms: Tuple[str, ...]
+    
+    @classmethod
+    def from_dict(cls, creator_profile: Dict[str, Any]) -> "NormalizedProfile":
+        niche = creator_profile.get("niche", "general")
+        return cls(
+            followers=creator_profile.get("total_followers", 0),
+            engagement=creator_profile.get("engagement_rate", 0.03),
+            niche=niche,
+            niche_code=_niche_code(niche),
+            expertise=creator_profile.get("expertise_level", "intermediate"),
+            monthly_views=creator_profile.get("monthly_views", 100000),
+            platforms=tuple(creator_profile.get("platforms", ()))
+        )
+
+
+_REVENUE_STREAMS = tuple(RevenueStream)
+_REVENUE_STREAM_CODES = MappingProxyType({stream: i for i, stream in enumerate(_REVENUE_STREAMS)})
+
+
+@dataclass(slots=True, eq=False)
+class OpportunityTable:
+    """Column view of a ranked opportunity list for the aggregate calculations
+    
+    Action steps are stored CSR-style: the steps of opportunity i are
+    steps_flat[steps_offsets[i]:steps_offsets[i + 1]].
+    """
+    revenue: np.ndarray
+    probability: np.ndarray
+    time_to_revenue: np.ndarray
+    stream: np.ndarray
+    steps_flat: List[str]
+    steps_offsets: np.ndarray
+    
+    @classmethod
+    def from_opportunities(cls, opportunities: List[RevenueOpportunity]) -> "OpportunityTable":
+        count = len(opportunities)
+        steps_flat = []
+        steps_offsets = np.zeros(count + 1, dtype=np.int32)
+        for i, opp in enumerate(opportunities):
+            steps_flat.extend(opp.action_steps)
+            steps_offsets[i + 1] = len(steps_flat)
+        
+        return cls(
+            revenue=np.fromiter((o.estimated_revenue for o in opportunities), dtype=np.float64, count=count),
+            probability=np.fromiter((o.success_probability for o in opportunities), dtype=np.float64, count=count),
+            time_to_revenue=np.fromiter((o.time_to_revenue for o in opportunities), dtype=np.int64, count=count),
+            stream=np.fromiter(
+                (_REVENUE_STREAM_CODES[o.revenue_stream] for o in opportunities), dtype=np.int32, count=count
+            ),
+            steps_flat=steps_flat,
+            steps_offsets=steps_offsets
+        )
+    
+    def __len__(self) -> int:
+        return self.revenue.size
+    
+    def steps(self, i: int) -> List[str]:
+        return self.steps_flat[self.steps_offsets[i]:self.steps_offsets[i + 1]]
+
+
+# Roadmap phase without dates: (stream, days to revenue, revenue, probability, milestones)
+RoadmapPhase = Tuple[str, int, float, float, Tuple[str, ...]]
+
+
+@dataclass(slots=True, frozen=True)
+class CachedAnalysis:
+    """Per-profile analysis kept between calls; only the roadmap dates are recomputed"""
+    opportunities: List[RevenueOpportunity]
+    current_revenue: float
+    optimization_potential: float
+    roadmap_phases: Tuple[RoadmapPhase, ...]
+    next_steps: Tuple[str, ...]
+    success_probability: float
+
+
+_OPPORTUNITY_FIELDS = tuple(f.name for f in fields(RevenueOpportunity))
+
+
+def _opp_to_dict(opp: RevenueOpportunity) -> Dict[str, Any]:
+    """Dict of an opportunity for responses; list and dict fields are copied, not shared"""
+    result = {}
+    for name in _OPPORTUNITY_FIELDS:
+        value = getattr(opp, name)
+        if isinstance(value, list):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        result[name] = value
+    return result
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback: enums by value, datetimes as ISO-8601, dataclasses as dicts, else str"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    return str(value)
+
+
+def _dumps(value: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(value, default=_json_default, option=option)
+    return json.dumps(value, default=_json_default, sort_keys=sort_keys).encode()
+
+
+def _profile_key(creator_profile: Dict[str, Any]) -> bytes:
+    """Canonical 128-bit digest of a creator profile, independent of key order"""
+    return hashlib.blake2b(_dumps(creator_profile, sort_keys=True), digest_size=16).digest()
+
+
+def _detached_copy(opp: RevenueOpportunity, **changes: Any) -> RevenueOpportunity:
+    """Copy of an opportunity that shares none of its list or dict fields with the original"""
+    return replace(
+        opp,
+        content_requirements=list(opp.content_requirements),
+        technical_requirements=list(opp.technical_requirements),
+        action_steps=list(opp.action_steps),
+        success_metrics=dict(opp.success_metrics),
+        **changes
+    )
+
+
+def _with_fresh_id(opp: RevenueOpportunity) -> RevenueOpportunity:
+    """Detached copy of a cached opportunity under a newly generated id with the same prefix"""
+    prefix = opp.opportunity_id.rsplit("_", 1)[0]
+    return _detached_copy(opp, opportunity_id=f"{prefix}_{secrets.token_hex(4)}")
+
+
+@lru_cache(maxsize=1)
+def _iso_for_second(epoch_second: int) -> str:
+    return datetime.fromtimestamp(epoch_second).isoformat()
+
+
+def _timestamp() -> str:
+    """Current local time as ISO-8601, formatted at most once per second"""
+    return _iso_for_second(int(time.time()))
+
+
+_PROMO_PROMPT = """Create {content_type} content for promoting:
+
+Revenue Stream: {stream}
+Target Audience: {audience} enthusiasts
+Key Benefits: {benefits}
+Price Point: ${price}
+
+Create engaging, authentic promotional content that:
+1. Highlights the value proposition
+2. Addresses potential objections
+3. Includes a clear call-to-action
+4. Feels natural and not overly salesy
+5. Is optimized for social media platforms
+
+Format as engaging social media post."""
+
+
+# Priority weight for an optimization's implementation effort
+_EFFORT_MULTIPLIERS = MappingProxyType({"low": 1.0, "medium": 0.7, "high": 0.4})
+
+# AI content generation: per-call timeout, and the consecutive failures that
+# open the circuit breaker for the cooldown period (seconds)
+_AI_CALL_TIMEOUT = 30.0
+_AI_FAILURE_THRESHOLD = 3
+_AI_CIRCUIT_COOLDOWN = 60.0
+
+# Maximum number of creator profiles whose analysis is memoized
+_ANALYSIS_CACHE_SIZE = 1024
+
+# Promotional content is reused across opportunities with the same niche,
+# revenue stream and price tier for up to an hour
+_PROMO_CACHE_SIZE = 1024
+_PROMO_CACHE_TTL = 3600.0
+
+
+def _price_tier(price: float) -> int:
+    """Quarter-decade price bucket ($10-17, $17-31, $31-56, $56-100, ...)"""
+    return int(math.log10(max(price, 1.0)) * 4)
+
+
+# Revenue prediction models
+_REVENUE_MODELS = MappingProxyType({
+    "content_creator": {
+        "ad_revenue_per_1k_views": {"youtube": 2.5, "tiktok": 0.8, "instagram": 1.2},
+        "affiliate_conversion_rates": {"tech": 0.05, "lifestyle": 0.03, "business": 0.08},
+        "course_pricing_sweet_spots": {"beginner": 97, "intermediate": 297, "advanced": 997},
+        "membership_retention_rates": {"monthly": 0.85, "annual": 0.92}
+    },
+    "business": {
+        "saas_metrics": {"monthly_churn": 0.05, "expansion_revenue": 0.15},
+        "consulting_rates": {"junior": 150, "senior": 300, "expert": 500},
+        "speaking_fees": {"local": 2500, "national": 7500, "international": 15000}
+    }
+})
+
+# Industry performance benchmarks
+_INDUSTRY_BENCHMARKS = MappingProxyType({
+    "conversion_rates": {
+        "email_marketing": 0.18,
+        "social_media": 0.025,
+        "content_marketing": 0.06,
+        "paid_advertising": 0.035
+    },
+    "customer_acquisition_costs": {
+        "organic_social": 25,
+        "paid_social": 45,
+        "email_marketing": 15,
+        "content_marketing": 35
+    }
+})
+
+# Revenue optimization strategies
+_OPTIMIZATION_STRATEGIES = MappingProxyType({
+    "pricing_optimization": {
+        "a_b_test_prices": [0.8, 1.0, 1.2, 1.5],  # Price multipliers
+        "psychological_pricing": [97, 197, 297, 497, 997],
+        "bundle_strategies": ["basic_premium", "good_better_best", "freemium_premium"]
+    },
+    "conversion_optimization": {
+        "landing_page_elements": ["headline", "value_proposition", "social_proof", "cta"],
+        "email_sequences": ["welcome", "nurture", "sales", "retention"],
+        "retargeting_strategies": ["cart_abandonment", "content_engagement", "lookalike_audiences"]
+    },
+    "retention_optimization": {
+        "onboarding_sequences": ["welcome", "quick_wins", "feature_discovery"],
+        "engagement_campaigns": ["milestone_celebrations", "exclusive_content", "community_building"],
+        "win_back_campaigns": ["special_offers", "feedback_requests", "re_engagement"]
+    }
+})
+
+# Pricing lookup tables for the opportunity scoring helpers. Niche tables are
+# tuples indexed by niche code; unknown niches map to the trailing entry, which
+# holds each table's default.
+_NICHES = ("tech", "business", "finance", "health", "lifestyle", "entertainment", "marketing")
+_NICHE_INDEX = MappingProxyType({niche: i for i, niche in enumerate(_NICHES)})
+_UNKNOWN_NICHE = len(_NICHES)
+
+
+def _niche_code(niche: str) -> int:
+    return _NICHE_INDEX.get(niche, _UNKNOWN_NICHE)
+
+
+#                        tech  business finance health lifestyle entertainment marketing default
+_NICHE_PARTNERSHIP_MULT = (1.5,  1.4,     1.6,    1.3,   1.0,      0.8,          1.0,      1.0)
+_COURSE_NICHE_MULT =      (1.4,  1.3,     1.5,    1.0,   0.8,      1.0,          1.2,      1.0)
+_AFFILIATE_CONV =         (0.05, 0.04,    0.06,   0.035, 0.03,     0.03,         0.03,     0.03)
+_AFFILIATE_COMMISSION =   (25,   30,      40,     20,    15,       20,           20,       20)
+
+_COURSE_BASE_PRICES = MappingProxyType({
+    "beginner": 97,
+    "intermediate": 297,
+    "advanced": 997,
+    "expert": 1997
+})
+
+# Array views of the niche tables for batch scoring
+_PARTNERSHIP_MULT_LUT = np.array(_NICHE_PARTNERSHIP_MULT, dtype=np.float64)
+_COURSE_NICHE_MULT_LUT = np.array(_COURSE_NICHE_MULT, dtype=np.float64)
+_AFFILIATE_CONV_LUT = np.array(_AFFILIATE_CONV, dtype=np.float64)
+_AFFILIATE_COMMISSION_LUT = np.array(_AFFILIATE_COMMISSION, dtype=np.float64)
+
+
 class RevenueIntelligenceEngine:
     """AI-powered revenue intelligence and optimization"""
     
     def __init__(self):
-        self.revenue_models = self._load_revenue_models()
-        self.industry_benchmarks = self._load_industry_benchmarks()
-    
-    def _load_revenue_models(self) -> Dict[str, Any]:
-        """Load revenue prediction models"""
-        return {
-            "content_creator": {
-                "ad_revenue_per_1k_views": {"youtube": 2.5, "tiktok": 0.8, "instagram": 1.2},
-                "affiliate_conversion_rates": {"tech": 0.05, "lifestyle": 0.03, "business": 0.08},
-                "course_pricing_sweet_spots": {"beginner": 97, "intermediate": 297, "advanced": 997},
-                "membership_retention_rates": {"monthly": 0.85, "annual": 0.92}
-            },
-            "business": {
-                "saas_metrics": {"monthly_churn": 0.05, "expansion_revenue": 0.15},
-                "consulting_rates": {"junior": 150, "senior": 300, "expert": 500},
-                "speaking_fees": {"local": 2500, "national": 7500, "international": 15000}
-            }
-        }
-    
-    def _load_industry_benchmarks(self) -> Dict[str, Any]:
-        """Load industry performance benchmarks"""
-        return {
-            "conversion_rates": {
-                "email_marketing": 0.18,
-                "social_media": 0.025,
-                "content_marketing": 0.06,
-                "paid_advertising": 0.035
-            },
-            "customer_acquisition_costs": {
-                "organic_social": 25,
-                "paid_social": 45,
-                "email_marketing": 15,
-                "content_marketing": 35
-            }
-        }
+        self.revenue_models = _REVENUE_MODELS
+        self.industry_benchmarks = _INDUSTRY_BENCHMARKS
     
     async def analyze_revenue_opportunities(self, creator_profile: Dict[str, Any]) -> List[RevenueOpportunity]:
         """Analyze and identify revenue opportunities"""
         opportunities = []
         
         # Analyze current metrics
-        followers = creator_profile.get("total_followers", 0)
-        engagement_rate = creator_profile.get("engagement_rate", 0.03)
-        niche = creator_profile.get("niche", "general")
-        platforms = creator_profile.get("platforms", [])
+        profile = NormalizedProfile.from_dict(creator_profile)
         
         # Generate opportunities based on profile
-        if followers >= 10000:
-            opportunities.extend(await self._generate_influencer_opportunities(creator_profile))
+        if profile.followers >= 10000:
+            opportunities.extend(await self._generate_influencer_opportunities(profile))
         
-        if followers >= 50000:
-            opportunities.extend(await self._generate_brand_partnership_opportunities(creator_profile))
+        if profile.followers >= 50000:
+            opportunities.extend(await self._generate_brand_partnership_opportunities(profile))
         
-        if engagement_rate > 0.05:
-            opportunities.extend(await self._generate_product_opportunities(creator_profile))
+        if profile.engagement > 0.05:
+            opportunities.extend(await self._generate_product_opportunities(profile))
         
         # Always available opportunities
-        opportunities.extend(await self._generate_content_monetization_opportunities(creator_profile))
+        opportunities.extend(await self._generate_content_monetization_opportunities(profile))
         
-        # Sort by estimated revenue potential
-        opportunities.sort(key=lambda x: float(x.estimated_revenue), reverse=True)
+        # Rank by estimated revenue potential
+        return self._select_top_opportunities(opportunities, 10)  # Return top 10 opportunities
+    
+    def analyze_revenue_opportunities_batch(self, creator_profiles: List[Dict[str, Any]]) -> List[List[RevenueOpportunity]]:
+        """Analyze many creator profiles at once, scoring every opportunity with array math"""
+        if not creator_profiles:
+            return []
+        
+        # Profile columns
+        profiles = [NormalizedProfile.from_dict(p) for p in creator_profiles]
+        followers = np.array([p.followers for p in profiles], dtype=np.float64)
+        engagement = np.array([p.engagement for p in profiles], dtype=np.float64)
+        monthly_views = np.array([p.monthly_views for p in profiles], dtype=np.float64)
+        base_prices = np.array([_COURSE_BASE_PRICES.get(p.expertise, 297) for p in profiles], dtype=np.float64)
+        niche_idx = np.array([p.niche_code for p in profiles], dtype=np.intp)
+        
+        # Array twins of the scalar kernels behind the _calculate_* helpers
+        sponsored = _scoring.sponsored_post_rates(followers, engagement)
+        partnership = _scoring.brand_partnership_values(followers, _PARTNERSHIP_MULT_LUT[niche_idx])
+        course_price = _scoring.course_prices(base_prices, _COURSE_NICHE_MULT_LUT[niche_idx])
+        students = _scoring.course_enrollments(followers, engagement)
+        affiliate = _scoring.affiliate_potentials(
+            monthly_views, _AFFILIATE_CONV_LUT[niche_idx], _AFFILIATE_COMMISSION_LUT[niche_idx]
+        )
         
-        return opportunities[:10]  # Return top 10 opportunities
+        rows = zip(
+            followers.tolist(), engagement.tolist(), sponsored.tolist(), partnership.tolist(),
+            course_price.tolist(), students.tolist(), affiliate.tolist()
+        )
+        
+        results = []
+        for n_followers, rate, sponsored_rate, partnership_value, price, enrolled, affiliate_revenue in rows:
+            opportunities = []
+            
+            if n_followers >= 10000:
+                opportunities.append(self._build_sponsored_opportunity(sponsored_rate))
+            
+            if n_followers >= 50000:
+                opportunities.append(self._build_partnership_opportunity(partnership_value))
+            
+            if rate > 0.05:
+                opportunities.append(self._build_course_opportunity(price, enrolled))
+            
+            opportunities.append(self._build_affiliate_opportunity(affiliate_revenue))
+            
+            results.append(self._select_top_opportunities(opportunities, 10))
+        
+        return results
+    
+    @staticmethod
+    def _select_top_opportunities(opportunities: List[RevenueOpportunity], limit: int) -> List[RevenueOpportunity]:
+        """Top opportunities by estimated revenue, best first (partial selection before sorting)"""
+        if len(opportunities) > limit:
+            revenues = np.fromiter(
+                (opp.estimated_revenue for opp in opportunities), dtype=np.float64, count=len(opportunities)
+            )
+            top_idx = np.argpartition(-revenues, limit - 1)[:limit]
+            opportunities = [opportunities[i] for i in top_idx]
+        
+        return sorted(opportunities, key=lambda x: x.estimated_revenue, reverse=True)
     
-    async def _generate_influencer_opportunities(self, profile: Dict[str, Any]) -> List[RevenueOpportunity]:
+    async def _generate_influencer_opportunities(self, profile: NormalizedProfile) -> List[RevenueOpportunity]:
         """Generate influencer-specific opportunities"""
         opportunities = []
         
-        followers = profile.get("total_followers", 0)
-        engagement_rate = profile.get("engagement_rate", 0.03)
-        
         # Sponsored content opportunity
-        sponsored_rate = self._calculate_sponsored_post_rate(followers, engagement_rate)
+        sponsored_rate = self._calculate_sponsored_post_rate(profile.followers, profile.engagement)
+        
+        opportunities.append(self._build_sponsored_opportunity(sponsored_rate))
+        
+        return opportunities
+    
+    async def _generate_brand_partnership_opportunities(self, profile: NormalizedProfile) -> List[RevenueOpportunity]:
+        """Generate brand partnership opportunities"""
+        opportunities = []
+        
+        # Long-term brand partnership
+        monthly_partnership_value = self._calculate_brand_partnership_value(profile.followers, profile.niche_code)
+        
+        opportunities.append(self._build_partnership_opportunity(monthly_partnership_value))
+        
+        return opportunities
+    
+    async def _generate_product_opportunities(self, profile: NormalizedProfile) -> List[RevenueOpportunity]:
+        """Generate product-based opportunities"""
+        opportunities = []
+        
+        # Digital course opportunity
+        course_price = self._calculate_optimal_course_price(profile.niche_code, profile.expertise)
+        expected_students = self._estimate_course_enrollment(profile)
+        
+        opportunities.append(self._build_course_opportunity(course_price, expected_students))
+        
+        return opportunities
+    
+    async def _generate_content_monetization_opportunities(self, profile: NormalizedProfile) -> List[RevenueOpportunity]:
+        """Generate content monetization opportunities"""
+        opportunities = []
+        
+        # Affiliate marketing opportunity
+        affiliate_revenue = self._calculate_affiliate_potential(profile.niche_code, profile.monthly_views)
+        
+        opportunities.append(self._build_affiliate_opportunity(affiliate_revenue))
         
-        opportunities.append(RevenueOpportunity(
-            opportunity_id=f"sponsored_{uuid.uuid4().hex[:8]}",
+        return opportunities
+    
+    def _build_sponsored_opportunity(self, sponsored_rate: float) -> RevenueOpportunity:
+        """Build the sponsored content opportunity for a post rate"""
+        return RevenueOpportunity(
+            opportunity_id=f"sponsored_{secrets.token_hex(4)}",
             revenue_stream=RevenueStream.SPONSORED_CONTENT,
             strategy=MonetizationStrategy.PERFORMANCE_BASED,
             target_segment=AudienceSegment.ENGAGED_FOLLOWERS,
-            estimated_revenue=Decimal(str(sponsored_rate * 4)),  # 4 posts per month
+            estimated_revenue=sponsored_rate * 4,  # 4 posts per month
             implementation_effort=3,
             time_to_revenue=14,
             success_probability=0.8,
@@ -211,8 +559,8 @@ class RevenueIntelligenceEngine:
             content_requirements=["High-quality posts", "Brand alignment", "Authentic integration"],
             technical_requirements=["Media kit", "Rate card", "Portfolio"],
             conversion_rate=0.15,
-            average_order_value=Decimal(str(sponsored_rate)),
-            customer_lifetime_value=Decimal(str(sponsored_rate * 12)),
+            average_order_value=sponsored_rate,
+            customer_lifetime_value=sponsored_rate * 12,
             action_steps=[
                 "Create professional media kit",
                 "Reach out to relevant brands",
@@ -220,26 +568,16 @@ class RevenueIntelligenceEngine:
                 "Create sponsored content"
             ],
             success_metrics={"posts_per_month": 4, "average_rate": sponsored_rate}
-        ))
-        
-        return opportunities
+        )
     
-    async def _generate_brand_partnership_opportunities(self, profile: Dict[str, Any]) -> List[RevenueOpportunity]:
-        """Generate brand partnership opportunities"""
-        opportunities = []
-        
-        followers = profile.get("total_followers", 0)
-        niche = profile.get("niche", "general")
-        
-        # Long-term brand partnership
-        monthly_partnership_value = self._calculate_brand_partnership_value(followers, niche)
-        
-        opportunities.append(RevenueOpportunity(
-            opportunity_id=f"partnership_{uuid.uuid4().hex[:8]}",
+    def _build_partnership_opportunity(self, monthly_partnership_value: float) -> RevenueOpportunity:
+        """Build the long-term brand partnership opportunity for a monthly value"""
+        return RevenueOpportunity(
+            opportunity_id=f"partnership_{secrets.token_hex(4)}",
             revenue_stream=RevenueStream.BRAND_PARTNERSHIPS,
             strategy=MonetizationStrategy.SUBSCRIPTION,
             target_segment=AudienceSegment.ENGAGED_FOLLOWERS,
-            estimated_revenue=Decimal(str(monthly_partnership_value * 6)),  # 6-month deal
+            estimated_revenue=monthly_partnership_value * 6,  # 6-month deal
             implementation_effort=7,
             time_to_revenue=45,
             success_probability=0.6,
@@ -247,8 +585,8 @@ class RevenueIntelligenceEngine:
             content_requirements=["Consistent brand messaging", "Quality content", "Regular posting"],
             technical_requirements=["Contract negotiation", "Content calendar", "Performance tracking"],
             conversion_rate=0.08,
-            average_order_value=Decimal(str(monthly_partnership_value)),
-            customer_lifetime_value=Decimal(str(monthly_partnership_value * 12)),
+            average_order_value=monthly_partnership_value,
+            customer_lifetime_value=monthly_partnership_value * 12,
             action_steps=[
                 "Identify target brands",
                 "Create partnership proposal",
@@ -256,27 +594,16 @@ class RevenueIntelligenceEngine:
                 "Execute partnership agreement"
             ],
             success_metrics={"partnership_duration": 6, "monthly_value": monthly_partnership_value}
-        ))
-        
-        return opportunities
+        )
     
-    async def _generate_product_opportunities(self, profile: Dict[str, Any]) -> List[RevenueOpportunity]:
-        """Generate product-based opportunities"""
-        opportunities = []
-        
-        niche = profile.get("niche", "general")
-        expertise_level = profile.get("expertise_level", "intermediate")
-        
-        # Digital course opportunity
-        course_price = self._calculate_optimal_course_price(niche, expertise_level)
-        expected_students = self._estimate_course_enrollment(profile)
-        
-        opportunities.append(RevenueOpportunity(
-            opportunity_id=f"course_{uuid.uuid4().hex[:8]}",
+    def _build_course_opportunity(self, course_price: float, expected_students: int) -> RevenueOpportunity:
+        """Build the digital course opportunity for a price and enrollment estimate"""
+        return RevenueOpportunity(
+            opportunity_id=f"course_{secrets.token_hex(4)}",
             revenue_stream=RevenueStream.COURSE_SALES,
             strategy=MonetizationStrategy.ONE_TIME_PURCHASE,
             target_segment=AudienceSegment.ENGAGED_FOLLOWERS,
-            estimated_revenue=Decimal(str(course_price * expected_students)),
+            estimated_revenue=course_price * expected_students,
             implementation_effort=8,
             time_to_revenue=90,
             success_probability=0.7,
@@ -284,8 +611,8 @@ class RevenueIntelligenceEngine:
             content_requirements=["Course curriculum", "Video lessons", "Workbooks", "Community access"],
             technical_requirements=["Course platform", "Payment processing", "Student management"],
             conversion_rate=0.02,
-            average_order_value=Decimal(str(course_price)),
-            customer_lifetime_value=Decimal(str(course_price * 1.5)),  # Upsells
+            average_order_value=course_price,
+            customer_lifetime_value=course_price * 1.5,  # Upsells
             action_steps=[
                 "Validate course idea",
                 "Create course outline",
@@ -294,26 +621,16 @@ class RevenueIntelligenceEngine:
                 "Launch marketing campaign"
             ],
             success_metrics={"students_enrolled": expected_students, "course_completion_rate": 0.65}
-        ))
-        
-        return opportunities
+        )
     
-    async def _generate_content_monetization_opportunities(self, profile: Dict[str, Any]) -> List[RevenueOpportunity]:
-        """Generate content monetization opportunities"""
-        opportunities = []
-        
-        # Affiliate marketing opportunity
-        niche = profile.get("niche", "general")
-        monthly_views = profile.get("monthly_views", 100000)
-        
-        affiliate_revenue = self._calculate_affiliate_potential(niche, monthly_views)
-        
-        opportunities.append(RevenueOpportunity(
-            opportunity_id=f"affiliate_{uuid.uuid4().hex[:8]}",
+    def _build_affiliate_opportunity(self, affiliate_revenue: float) -> RevenueOpportunity:
+        """Build the affiliate marketing opportunity for a monthly revenue estimate"""
+        return RevenueOpportunity(
+            opportunity_id=f"affiliate_{secrets.token_hex(4)}",
             revenue_stream=RevenueStream.AFFILIATE_MARKETING,
             strategy=MonetizationStrategy.COMMISSION_BASED,
             target_segment=AudienceSegment.ENGAGED_FOLLOWERS,
-            estimated_revenue=Decimal(str(affiliate_revenue)),
+            estimated_revenue=affiliate_revenue,
             implementation_effort=4,
             time_to_revenue=30,
             success_probability=0.85,
@@ -321,8 +638,8 @@ class RevenueIntelligenceEngine:
             content_requirements=["Product reviews", "Tutorials", "Honest recommendations"],
             technical_requirements=["Affiliate links", "Tracking setup", "Disclosure compliance"],
             conversion_rate=0.03,
-            average_order_value=Decimal("50"),
-            customer_lifetime_value=Decimal("150"),
+            average_order_value=50.0,
+            customer_lifetime_value=150.0,
             action_steps=[
                 "Research affiliate programs",
                 "Apply to relevant programs",
@@ -330,115 +647,36 @@ class RevenueIntelligenceEngine:
                 "Track and optimize performance"
             ],
             success_metrics={"monthly_affiliate_revenue": affiliate_revenue, "conversion_rate": 0.03}
-        ))
-        
-        return opportunities
+        )
     
     def _calculate_sponsored_post_rate(self, followers: int, engagement_rate: float) -> float:
         """Calculate sponsored post rate"""
-        base_rate = followers * 0.01  # $0.01 per follower
-        engagement_multiplier = max(1.0, engagement_rate * 20)  # Boost for high engagement
-        return min(base_rate * engagement_multiplier, 10000)  # Cap at $10k
+        return _scoring.sponsored_post_rate(followers, engagement_rate)
     
-    def _calculate_brand_partnership_value(self, followers: int, niche: str) -> float:
+    def _calculate_brand_partnership_value(self, followers: int, niche_code: int) -> float:
         """Calculate monthly brand partnership value"""
-        base_value = followers * 0.05  # $0.05 per follower per month
-        
-        niche_multipliers = {
-            "tech": 1.5,
-            "business": 1.4,
-            "finance": 1.6,
-            "health": 1.3,
-            "lifestyle": 1.0,
-            "entertainment": 0.8
-        }
-        
-        multiplier = niche_multipliers.get(niche, 1.0)
-        return base_value * multiplier
+        return _scoring.brand_partnership_value(followers, _NICHE_PARTNERSHIP_MULT[niche_code])
     
-    def _calculate_optimal_course_price(self, niche: str, expertise_level: str) -> float:
+    def _calculate_optimal_course_price(self, niche_code: int, expertise_level: str) -> float:
         """Calculate optimal course pricing"""
-        base_prices = {
-            "beginner": 97,
-            "intermediate": 297,
-            "advanced": 997,
-            "expert": 1997
-        }
-        
-        niche_multipliers = {
-            "business": 1.3,
-            "tech": 1.4,
-            "finance": 1.5,
-            "marketing": 1.2,
-            "lifestyle": 0.8
-        }
-        
-        base_price = base_prices.get(expertise_level, 297)
-        multiplier = niche_multipliers.get(niche, 1.0)
-        
-        return base_price * multiplier
+        return _scoring.course_price(_COURSE_BASE_PRICES.get(expertise_level, 297), _COURSE_NICHE_MULT[niche_code])
     
-    def _estimate_course_enrollment(self, profile: Dict[str, Any]) -> int:
+    def _estimate_course_enrollment(self, profile: NormalizedProfile) -> int:
         """Estimate course enrollment based on profile"""
-        followers = profile.get("total_followers", 0)
-        engagement_rate = profile.get("engagement_rate", 0.03)
-        
-        # Conservative estimate: 0.5-2% of engaged followers
-        engaged_followers = followers * engagement_rate
-        conversion_rate = 0.01  # 1% of engaged followers buy course
-        
-        return max(int(engaged_followers * conversion_rate), 10)
+        return _scoring.course_enrollment(profile.followers, profile.engagement)
     
-    def _calculate_affiliate_potential(self, niche: str, monthly_views: int) -> float:
+    def _calculate_affiliate_potential(self, niche_code: int, monthly_views: int) -> float:
         """Calculate monthly affiliate revenue potential"""
-        conversion_rates = {
-            "tech": 0.05,
-            "business": 0.04,
-            "lifestyle": 0.03,
-            "health": 0.035,
-            "finance": 0.06
-        }
-        
-        average_commissions = {
-            "tech": 25,
-            "business": 30,
-            "lifestyle": 15,
-            "health": 20,
-            "finance": 40
-        }
-        
-        conversion_rate = conversion_rates.get(niche, 0.03)
-        avg_commission = average_commissions.get(niche, 20)
-        
-        monthly_conversions = monthly_views * conversion_rate
-        return monthly_conversions * avg_commission
+        return _scoring.affiliate_potential(
+            monthly_views, _AFFILIATE_CONV[niche_code], _AFFILIATE_COMMISSION[niche_code]
+        )
 
 
 class RevenueOptimizer:
     """Optimizes revenue streams for maximum performance"""
     
     def __init__(self):
-        self.optimization_strategies = self._load_optimization_strategies()
-    
-    def _load_optimization_strategies(self) -> Dict[str, Any]:
-        """Load revenue optimization strategies"""
-        return {
-            "pricing_optimization": {
-                "a_b_test_prices": [0.8, 1.0, 1.2, 1.5],  # Price multipliers
-                "psychological_pricing": [97, 197, 297, 497, 997],
-                "bundle_strategies": ["basic_premium", "good_better_best", "freemium_premium"]
-            },
-            "conversion_optimization": {
-                "landing_page_elements": ["headline", "value_proposition", "social_proof", "cta"],
-                "email_sequences": ["welcome", "nurture", "sales", "retention"],
-                "retargeting_strategies": ["cart_abandonment", "content_engagement", "lookalike_audiences"]
-            },
-            "retention_optimization": {
-                "onboarding_sequences": ["welcome", "quick_wins", "feature_discovery"],
-                "engagement_campaigns": ["milestone_celebrations", "exclusive_content", "community_building"],
-                "win_back_campaigns": ["special_offers", "feedback_requests", "re_engagement"]
-            }
-        }
+        self.optimization_strategies = _OPTIMIZATION_STRATEGIES
     
     async def optimize_revenue_stream(self, campaign: MonetizationCampaign, 
                                     performance_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -465,7 +703,7 @@ class RevenueOptimizer:
         
         return {
             "campaign_id": campaign.campaign_id,
-            "optimization_date": datetime.now().isoformat(),
+            "optimization_date": _timestamp(),
             "current_performance": performance_data,
             "recommended_optimizations": optimizations,
             "ab_test_recommendations": ab_tests,
@@ -581,13 +819,13 @@ class RevenueOptimizer:
     
     def _prioritize_optimizations(self, optimizations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prioritize optimizations by impact vs effort"""
-        def priority_score(opt):
-            impact = opt.get("expected_lift", 0.0)
-            effort_multiplier = {"low": 1.0, "medium": 0.7, "high": 0.4}
-            effort = effort_multiplier.get(opt.get("effort", "medium"), 0.7)
-            return impact * effort
-        
-        return sorted(optimizations, key=priority_score, reverse=True)
+        # Decorate with (-score, position) so ties keep their original order
+        scored = [
+            (-opt.get("expected_lift", 0.0) * _EFFORT_MULTIPLIERS.get(opt.get("effort", "medium"), 0.7), i, opt)
+            for i, opt in enumerate(optimizations)
+        ]
+        scored.sort()
+        return [opt for _, _, opt in scored]
 
 
 class AdvancedMonetizationEngine:
@@ -597,38 +835,73 @@ class AdvancedMonetizationEngine:
         self.intelligence_engine = RevenueIntelligenceEngine()
         self.optimizer = RevenueOptimizer()
         self.active_campaigns = {}
+        self._ai_failures = 0
+        self._ai_circuit_open_until = 0.0
+        self._analysis_cache: "OrderedDict[bytes, CachedAnalysis]" = OrderedDict()
+        self._promo_cache: "OrderedDict[Tuple[str, RevenueStream, int], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
     
     async def analyze_creator_monetization(self, creator_profile: Dict[str, Any]) -> Dict[str, Any]:
         """Comprehensive monetization analysis for creator"""
         
-        # Identify revenue opportunities
-        opportunities = await self.intelligence_engine.analyze_revenue_opportunities(creator_profile)
-        
-        # Calculate current revenue potential
-        current_revenue = self._calculate_current_revenue(creator_profile)
-        
-        # Calculate optimization potential
-        optimization_potential = sum(float(opp.estimated_revenue) for opp in opportunities[:5])
+        cache_key = _profile_key(creator_profile)
+        cached = self._analysis_cache.get(cache_key)
         
-        # Generate implementation roadmap
-        roadmap = self._generate_implementation_roadmap(opportunities)
+        if cached is not None:
+            # Unchanged profile: reuse the scored opportunities under fresh ids
+            self._analysis_cache.move_to_end(cache_key)
+            opportunities = [_with_fresh_id(opp) for opp in cached.opportunities]
+        else:
+            # Identify revenue opportunities
+            opportunities = await self.intelligence_engine.analyze_revenue_opportunities(creator_profile)
+            
+            # Columns for the aggregates below; independent of opportunity ids
+            table = OpportunityTable.from_opportunities(opportunities)
+            
+            # The cache keeps its own copies, so callers can't alter later results
+            cached = CachedAnalysis(
+                opportunities=[_detached_copy(opp) for opp in opportunities],
+                current_revenue=self._calculate_current_revenue(creator_profile),
+                optimization_potential=math.fsum(table.revenue[:5]),
+                roadmap_phases=self._rank_roadmap_phases(table, np.arange(min(len(table), 5))),
+                next_steps=self._generate_next_steps(table, np.arange(min(len(table), 3))),
+                success_probability=self._calculate_overall_success_probability(table)
+            )
+            self._analysis_cache[cache_key] = cached
+            if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
         
         return {
             "creator_id": creator_profile.get("creator_id", "unknown"),
-            "analysis_date": datetime.now().isoformat(),
-            "current_revenue_estimate": current_revenue,
-            "optimization_potential": optimization_potential,
-            "revenue_opportunities": [asdict(opp) for opp in opportunities],
-            "implementation_roadmap": roadmap,
-            "next_steps": self._generate_next_steps(opportunities[:3]),
-            "success_probability": self._calculate_overall_success_probability(opportunities)
+            "analysis_date": _timestamp(),
+            "current_revenue_estimate": cached.current_revenue,
+            "optimization_potential": cached.optimization_potential,
+            "revenue_opportunities": [_opp_to_dict(opp) for opp in opportunities],
+            "implementation_roadmap": self._generate_implementation_roadmap(cached.roadmap_phases),
+            "next_steps": list(cached.next_steps),
+            "success_probability": cached.success_probability
         }
     
+    async def stream_creator_monetization(self, creator_profile: Dict[str, Any]) -> AsyncIterator[bytes]:
+        """Monetization analysis as newline-delimited JSON
+        
+        Yields one line per revenue opportunity, then a summary line holding the
+        remaining analysis fields; suitable for a StreamingResponse body.
+        """
+        analysis = await self.analyze_creator_monetization(creator_profile)
+        opportunities = analysis.pop("revenue_opportunities")
+        
+        for opp_dict in opportunities:
+            yield _dumps(opp_dict) + b"\n"
+            # Let other requests run between lines
+            await asyncio.sleep(0)
+        
+        yield _dumps({"summary": analysis}) + b"\n"
+    
     async def create_monetization_campaign(self, opportunity: RevenueOpportunity,
                                          creator_profile: Dict[str, Any]) -> MonetizationCampaign:
         """Create monetization campaign from opportunity"""
         
-        campaign_id = f"mon_{uuid.uuid4().hex[:8]}"
+        campaign_id = f"mon_{secrets.token_hex(4)}"
         
         # Generate promotional content
         promotional_content = await self._generate_promotional_content(opportunity, creator_profile)
@@ -639,7 +912,7 @@ class AdvancedMonetizationEngine:
             name=f"{opportunity.revenue_stream.value.title()} Campaign",
             revenue_stream=opportunity.revenue_stream,
             strategy=opportunity.strategy,
-            target_revenue=opportunity.estimated_revenue,
+            target_revenue=Decimal.from_float(opportunity.estimated_revenue).quantize(Decimal("0.01")),
             current_revenue=Decimal("0"),
             start_date=datetime.now(),
             end_date=datetime.now() + timedelta(days=90),
@@ -662,47 +935,86 @@ class AdvancedMonetizationEngine:
                                           creator_profile: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate promotional content for monetization campaign"""
         
+        niche = creator_profile.get('niche', 'general')
+        cache_key = (niche, opportunity.revenue_stream, _price_tier(opportunity.average_order_value))
+        
+        cached = self._promo_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_pieces = cached
+            if time.monotonic() < expires_at:
+                self._promo_cache.move_to_end(cache_key)
+                return [dict(piece) for piece in cached_pieces]
+            del self._promo_cache[cache_key]
+        
+        content_pieces = await self._request_promotional_content(opportunity, niche)
+        
+        # Failed generations are not cached, so they are retried next time
+        if content_pieces:
+            self._promo_cache[cache_key] = (
+                time.monotonic() + _PROMO_CACHE_TTL, [dict(piece) for piece in content_pieces]
+            )
+            if len(self._promo_cache) > _PROMO_CACHE_SIZE:
+                self._promo_cache.popitem(last=False)
+        
+        return content_pieces
+    
+    async def _request_promotional_content(self, opportunity: RevenueOpportunity, niche: str) -> List[Dict[str, Any]]:
+        """Generate each promotional content type with the AI orchestrator"""
+        
         content_pieces = []
         
         # Generate different types of promotional content
         content_types = ["announcement", "benefits", "social_proof", "urgency", "faq"]
         
+        benefits = ', '.join(opportunity.content_requirements)
+        
+        ai_requests = []
         for content_type in content_types:
-            prompt = f"""Create {content_type} content for promoting:
-
-Revenue Stream: {opportunity.revenue_stream.value}
-Target Audience: {creator_profile.get('niche', 'general')} enthusiasts
-Key Benefits: {', '.join(opportunity.content_requirements)}
-Price Point: ${opportunity.average_order_value}
-
-Create engaging, authentic promotional content that:
-1. Highlights the value proposition
-2. Addresses potential objections
-3. Includes a clear call-to-action
-4. Feels natural and not overly salesy
-5. Is optimized for social media platforms
-
-Format as engaging social media post."""
+            prompt = _PROMO_PROMPT.format(
+                content_type=content_type,
+                stream=opportunity.revenue_stream.value,
+                audience=niche,
+                benefits=benefits,
+                price=opportunity.average_order_value
+            )
             
-            ai_request = AIRequest(
+            ai_requests.append(AIRequest(
                 prompt=prompt,
                 content_type=ContentType.MARKETING_COPY,
                 platform="social_media",
-                target_audience=creator_profile.get('niche', 'general'),
+                target_audience=niche,
                 temperature=0.7
-            )
+            ))
+        
+        # Circuit breaker: while the AI backend keeps failing, skip it rather than
+        # paying a timeout per piece
+        if time.monotonic() < self._ai_circuit_open_until:
+            logger.warning("AI content generation circuit open, skipping promotional content")
+            return content_pieces
+        
+        # The generations are independent round-trips, so issue them concurrently
+        responses = await asyncio.gather(
+            *(asyncio.wait_for(ai_orchestrator.generate_content(ai_request), _AI_CALL_TIMEOUT)
+              for ai_request in ai_requests),
+            return_exceptions=True
+        )
+        
+        for content_type, response in zip(content_types, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Failed to generate {content_type} content: {response}")
+                self._ai_failures += 1
+                if self._ai_failures >= _AI_FAILURE_THRESHOLD:
+                    self._ai_circuit_open_until = time.monotonic() + _AI_CIRCUIT_COOLDOWN
+                continue
             
-            try:
-                response = await ai_orchestrator.generate_content(ai_request)
-                content_pieces.append({
-                    "type": content_type,
-                    "content": response.content,
-                    "platform": "multi_platform",
-                    "estimated_reach": 1000,
-                    "estimated_engagement": 0.05
-                })
-            except Exception as e:
-                logger.error(f"Failed to generate {content_type} content: {e}")
+            self._ai_failures = 0
+            content_pieces.append({
+                "type": content_type,
+                "content": response.content,
+                "platform": "multi_platform",
+                "estimated_reach": 1000,
+                "estimated_engagement": 0.05
+            })
         
         return content_pieces
     
@@ -718,57 +1030,68 @@ Format as engaging social media post."""
         
         return ad_revenue * 12  # Annual estimate
     
-    def _generate_implementation_roadmap(self, opportunities: List[RevenueOpportunity]) -> List[Dict[str, Any]]:
+    def _rank_roadmap_phases(self, table: OpportunityTable, top_idx: np.ndarray) -> Tuple[RoadmapPhase, ...]:
+        """Roadmap phases for the opportunities at top_idx, in implementation order"""
+        # Sort by time to revenue, then by success probability (highest first)
+        order = top_idx[np.lexsort((-table.probability[top_idx], table.time_to_revenue[top_idx]))]
+        
+        return tuple(
+            (
+                _REVENUE_STREAMS[table.stream[j]].value,
+                int(table.time_to_revenue[j]),
+                float(table.revenue[j]),
+                float(table.probability[j]),
+                tuple(table.steps(j))
+            )
+            for j in order.tolist()
+        )
+    
+    def _generate_implementation_roadmap(self, phases: Tuple[RoadmapPhase, ...]) -> List[Dict[str, Any]]:
         """Generate implementation roadmap"""
         roadmap = []
-        
-        # Sort by time to revenue and success probability
-        sorted_opportunities = sorted(
-            opportunities[:5], 
-            key=lambda x: (x.time_to_revenue, -x.success_probability)
-        )
-        
         current_date = datetime.now()
         
-        for i, opp in enumerate(sorted_opportunities):
+        for i, (stream, time_to_revenue, revenue, probability, milestones) in enumerate(phases):
             start_date = current_date + timedelta(days=i * 30)  # Stagger implementations
-            end_date = start_date + timedelta(days=opp.time_to_revenue)
+            end_date = start_date + timedelta(days=time_to_revenue)
             
             roadmap.append({
                 "phase": i + 1,
-                "opportunity": opp.revenue_stream.value,
+                "opportunity": stream,
                 "start_date": start_date.isoformat(),
                 "end_date": end_date.isoformat(),
-                "estimated_revenue": float(opp.estimated_revenue),
-                "success_probability": opp.success_probability,
-                "key_milestones": opp.action_steps,
+                "estimated_revenue": revenue,
+                "success_probability": probability,
+                "key_milestones": list(milestones),
                 "dependencies": [] if i == 0 else [f"Phase {i}"]
             })
         
         return roadmap
     
-    def _generate_next_steps(self, top_opportunities: List[RevenueOpportunity]) -> List[str]:
-        """Generate immediate next steps"""
-        next_steps = []
-        
-        for opp in top_opportunities:
-            next_steps.extend(opp.action_steps[:2])  # First 2 steps for each opportunity
-        
-        return list(set(next_steps))[:10]  # Remove duplicates, limit to 10
+    def _generate_next_steps(self, table: OpportunityTable, top_idx: np.ndarray) -> Tuple[str, ...]:
+        """Generate immediate next steps for the opportunities at top_idx"""
+        next_steps: Dict[str, None] = {}
+        
+        # First two steps of each opportunity, de-duplicated in order and limited to 10
+        for i in top_idx.tolist():
+            for step in table.steps(i)[:2]:
+                if step not in next_steps:
+                    next_steps[step] = None
+                    if len(next_steps) == 10:
+                        return tuple(next_steps)
+        
+        return tuple(next_steps)
     
-    def _calculate_overall_success_probability(self, opportunities: List[RevenueOpportunity]) -> float:
+    def _calculate_overall_success_probability(self, table: OpportunityTable) -> float:
         """Calculate overall success probability"""
-        if not opportunities:
+        if len(table) == 0:
             return 0.0
         
-        # Weight by estimated revenue
-        total_revenue = sum(float(opp.estimated_revenue) for opp in opportunities)
-        weighted_probability = sum(
-            opp.success_probability * (float(opp.estimated_revenue) / total_revenue)
-            for opp in opportunities
-        )
+        total_revenue = table.revenue.sum()
+        if total_revenue == 0:
+            return 0.0
         
-        return weighted_probability
+        return float(np.dot(table.probability, table.revenue) / total_revenue)
 
 
 # Global monetization engine instance
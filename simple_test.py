@@ -1,9 +1,39 @@
 #!/usr/bin/env python3
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+async def _probe(client, method, path, **kwargs):
+    """Issue one request on the async client, returning the response or the error it raised"""
+    try:
+        return await client.request(method, path, **kwargs)
+    except httpx.HTTPError as e:
+        return e
+
+
+async def _fetch_concurrently(base_url, chat_data):
+    """Fetch the independent chat and agent capabilities probes concurrently"""
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0) as client:
+        return await asyncio.gather(
+            _probe(client, "POST", "/api/chat", json=chat_data),
+            _probe(client, "GET", "/api/agents/capabilities")
+        )
+
 def test_endpoints():
     """Test all the endpoints requested by the user"""
     
@@ -11,11 +41,15 @@ def test_endpoints():
     print("=" * 40)
     
     base_url = "http://localhost:9000"
+    # One keep-alive connection for every call; retry connection flakes
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                         max_retries=Retry(total=2, backoff_factor=0.2)))
     
     # Test 1: Check if backend is running
     print("\\n1. Testing if backend is running...")
     try:
-        response = requests.get(f"{base_url}/docs", timeout=5)
+        response = session.get(f"{base_url}/docs", timeout=5)
         if response.status_code == 200:
             print("✓ Backend is running - FastAPI docs accessible")
             print(f"  Status: {response.status_code}")
@@ -37,7 +71,7 @@ def test_endpoints():
     }
     
     try:
-        response = requests.post(f"{base_url}/api/auth/signup", json=signup_data)
+        response = session.post(f"{base_url}/api/auth/signup", json=signup_data)
         print(f"  Status: {response.status_code}")
         if response.status_code == 200:
             result = response.json()
@@ -60,7 +94,7 @@ def test_endpoints():
     }
     
     try:
-        response = requests.post(f"{base_url}/api/auth/login", json=login_data)
+        response = session.post(f"{base_url}/api/auth/login", json=login_data)
         print(f"  Status: {response.status_code}")
         if response.status_code == 200:
             result = response.json()
@@ -72,16 +106,25 @@ def test_endpoints():
     except Exception as e:
         print(f"✗ Login error: {e}")
     
-    # Test 4: Test AI chat functionality
-    print("\\n4. Testing AI chat functionality...")
     chat_data = {
         "message": "Hello, I need help with JavaScript",
         "user_id": "test_user",
         "engine": "llama"
     }
     
+    # Tests 4 and 5 are independent of each other, so their requests overlap
+    chat_response = capabilities_response = None
+    if httpx is not None:
+        chat_response, capabilities_response = asyncio.run(_fetch_concurrently(base_url, chat_data))
+    
+    # Test 4: Test AI chat functionality
+    print("\\n4. Testing AI chat functionality...")
     try:
-        response = requests.post(f"{base_url}/api/chat", json=chat_data)
+        response = chat_response
+        if response is None:
+            response = session.post(f"{base_url}/api/chat", json=chat_data)
+        if isinstance(response, Exception):
+            raise response
         print(f"  Status: {response.status_code}")
         if response.status_code == 200:
             result = response.json()
@@ -99,7 +142,11 @@ def test_endpoints():
     # Test 5: Test agent capabilities
     print("\\n5. Testing agent capabilities...")
     try:
-        response = requests.get(f"{base_url}/api/agents/capabilities")
+        response = capabilities_response
+        if response is None:
+            response = session.get(f"{base_url}/api/agents/capabilities")
+        if isinstance(response, Exception):
+            raise response
         print(f"  Status: {response.status_code}")
         if response.status_code == 200:
             result = response.json()
@@ -118,8 +165,11 @@ def test_endpoints():
     print("\\n6. Checking APK file...")
     apk_path = "/home/jd/AI_Tutor/android/app/build/outputs/apk/debug/app-debug.apk"
     
-    if os.path.exists(apk_path):
-        file_size = os.path.getsize(apk_path)
+    try:
+        file_size = os.stat(apk_path).st_size
+    except FileNotFoundError:
+        print(f"✗ APK file not found at: {apk_path}")
+    else:
         file_size_mb = file_size / (1024 * 1024)
         print("✓ APK file exists")
         print(f"  Path: {apk_path}")
@@ -127,13 +177,18 @@ def test_endpoints():
         
         # Check metadata
         metadata_path = os.path.join(os.path.dirname(apk_path), "output-metadata.json")
-        if os.path.exists(metadata_path):
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
-                print(f"  Application ID: {metadata.get('applicationId', 'unknown')}")
-                print(f"  Version: {metadata.get('elements', [{}])[0].get('versionName', 'unknown')}")
-    else:
-        print(f"✗ APK file not found at: {apk_path}")
+        try:
+            with open(metadata_path, 'rb') as f:
+                metadata = _json_loads(f.read())
+        except FileNotFoundError:
+            pass
+        else:
+            app_id = metadata.get('applicationId', 'unknown')
+            elements = metadata.get('elements')
+            version = elements[0].get('versionName', 'unknown') if elements else 'unknown'
+            del metadata
+            print(f"  Application ID: {app_id}")
+            print(f"  Version: {version}")
     
     print("\\n" + "=" * 40)
     print("Testing completed!")
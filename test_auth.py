@@ -1,23 +1,32 @@
 #!/usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import random
 
 API_URL = "http://localhost:9000/api"
 
 def test_auth():
     print("=== Nova AI Tutor Authentication Test ===")
     
+    # One keep-alive connection for every call; retry connection flakes
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                         max_retries=Retry(total=2, backoff_factor=0.2)))
+    
     # Test 1: Sign up
     print("\n1. Testing User Signup...")
+    suffix = random.randint(1000, 9999)
     signup_data = {
         "name": "Test User",
-        "email": f"test{import random; random.randint(1000, 9999)}@example.com",
+        "email": f"test{suffix}@example.com",
         "password": "password123"
     }
     
     try:
-        response = requests.post(f"{API_URL}/auth/signup", json=signup_data)
+        response = session.post(f"{API_URL}/auth/signup", json=signup_data)
         if response.status_code == 200:
             result = response.json()
             print(f"✓ Signup successful: {result['user']['name']} ({result['user']['email']})")
@@ -31,7 +40,7 @@ def test_auth():
                 "password": signup_data["password"]
             }
             
-            response = requests.post(f"{API_URL}/auth/login", json=login_data)
+            response = session.post(f"{API_URL}/auth/login", json=login_data)
             if response.status_code == 200:
                 result = response.json()
                 print(f"✓ Login successful: {result['user']['name']}")
@@ -44,7 +53,7 @@ def test_auth():
                     "engine": "llama"
                 }
                 
-                response = requests.post(f"{API_URL}/chat", json=chat_data)
+                response = session.post(f"{API_URL}/chat", json=chat_data)
                 if response.status_code == 200:
                     result = response.json()
                     if result.get('success'):
@@ -4,19 +4,64 @@ Backend Testing Script for Nova AI Tutor
 Tests all the endpoints requested by the user
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import sys
 import subprocess
 import time
 import signal
+import select
 import os
 from typing import Dict, Any
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+def _wait_ready(url, proc=None, deadline=8.0):
+    """Poll url with exponential backoff until the server answers or the deadline passes
+    
+    On failure, prints whatever the server process has written to stderr so far.
+    """
+    stop = time.monotonic() + deadline
+    delay = 0.1
+    while True:
+        try:
+            requests.get(url, timeout=0.5)
+            return True
+        except requests.exceptions.RequestException:
+            pass
+        
+        remaining = stop - time.monotonic()
+        if remaining <= 0 or (proc is not None and proc.poll() is not None):
+            break
+        time.sleep(min(delay, remaining))
+        delay *= 2
+    
+    if proc is not None and proc.stderr is not None:
+        readable, _, _ = select.select([proc.stderr], [], [], 0)
+        if readable:
+            print(os.read(proc.stderr.fileno(), 65536).decode(errors="replace"))
+    return False
+
+
+CHAT_REQUEST = {
+    "message": "Hello, I need help with JavaScript",
+    "user_id": "test_user",
+    "engine": "llama"
+}
+
+
 class BackendTester:
     def __init__(self, base_url: str = "http://localhost:9000"):
         self.base_url = base_url
         self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                                  max_retries=Retry(total=2, backoff_factor=0.2)))
         self.test_user_token = None
         
     def test_backend_running(self) -> bool:
@@ -48,9 +93,9 @@ class BackendTester:
                 "--reload", "--port", "9000", "--host", "0.0.0.0"
             ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             
-            # Wait a bit for server to start
+            # Wait for the server to accept connections
             print("⏳ Waiting for server to start...")
-            time.sleep(5)
+            _wait_ready(f"{self.base_url}/docs", proc)
             
             # Check if it's running
             if self.test_backend_running():
@@ -153,22 +198,34 @@ class BackendTester:
             print(f"❌ Login request failed: {e}")
             return {"status": "error", "error": str(e)}
     
-    def test_chat(self) -> Dict[str, Any]:
-        """Test the AI chat functionality"""
+    async def _probe(self, client, method: str, path: str, **kwargs):
+        """Issue one request on the async client, returning the response or the error it raised"""
+        try:
+            return await client.request(method, path, **kwargs)
+        except httpx.HTTPError as e:
+            return e
+    
+    async def _run_concurrent_probes(self):
+        """Fetch the independent chat and agent capabilities probes concurrently"""
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=60.0) as client:
+            return await asyncio.gather(
+                self._probe(client, "POST", "/api/chat", json=CHAT_REQUEST),
+                self._probe(client, "GET", "/api/agents/capabilities")
+            )
+    
+    def test_chat(self, response=None) -> Dict[str, Any]:
+        """Test the AI chat functionality (optionally from an already fetched response)"""
         print("\\n🤖 Testing AI chat endpoint...")
         
-        chat_data = {
-            "message": "Hello, I need help with JavaScript",
-            "user_id": "test_user",
-            "engine": "llama"
-        }
-        
         try:
-            response = self.session.post(
-                f"{self.base_url}/api/chat",
-                json=chat_data,
-                headers={"Content-Type": "application/json"}
-            )
+            if response is None:
+                response = self.session.post(
+                    f"{self.base_url}/api/chat",
+                    json=CHAT_REQUEST,
+                    headers={"Content-Type": "application/json"}
+                )
+            elif isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
                 result = response.json()
@@ -194,12 +251,15 @@ class BackendTester:
             print(f"❌ Chat request failed: {e}")
             return {"status": "error", "error": str(e)}
     
-    def test_agent_capabilities(self) -> Dict[str, Any]:
-        """Test the agent capabilities endpoint"""
+    def test_agent_capabilities(self, response=None) -> Dict[str, Any]:
+        """Test the agent capabilities endpoint (optionally from an already fetched response)"""
         print("\\n🎯 Testing agent capabilities endpoint...")
         
         try:
-            response = self.session.get(f"{self.base_url}/api/agents/capabilities")
+            if response is None:
+                response = self.session.get(f"{self.base_url}/api/agents/capabilities")
+            elif isinstance(response, Exception):
+                raise response
             
             if response.status_code == 200:
                 result = response.json()
@@ -235,27 +295,28 @@ class BackendTester:
         apk_path = "/home/jd/AI_Tutor/android/app/build/outputs/apk/debug/app-debug.apk"
         
         try:
-            if os.path.exists(apk_path):
-                file_size = os.path.getsize(apk_path)
-                file_size_mb = file_size / (1024 * 1024)
-                
-                print(f"✅ APK file exists")
-                print(f"   Path: {apk_path}")
-                print(f"   Size: {file_size_mb:.2f} MB ({file_size:,} bytes)")
-                
-                return {
-                    "status": "success",
-                    "path": apk_path,
-                    "size_bytes": file_size,
-                    "size_mb": file_size_mb
-                }
-            else:
+            try:
+                file_size = os.stat(apk_path).st_size
+            except FileNotFoundError:
                 print(f"❌ APK file not found at: {apk_path}")
                 return {
                     "status": "error",
                     "error": "APK file not found",
                     "path": apk_path
                 }
+            
+            file_size_mb = file_size / (1024 * 1024)
+            
+            print(f"✅ APK file exists")
+            print(f"   Path: {apk_path}")
+            print(f"   Size: {file_size_mb:.2f} MB ({file_size:,} bytes)")
+            
+            return {
+                "status": "success",
+                "path": apk_path,
+                "size_bytes": file_size,
+                "size_mb": file_size_mb
+            }
                 
         except Exception as e:
             print(f"❌ Error checking APK file: {e}")
@@ -281,11 +342,16 @@ class BackendTester:
         # Test 3: Test login
         results['login'] = self.test_login()
         
+        # Tests 4 and 5 are independent of each other, so their requests overlap
+        chat_response = capabilities_response = None
+        if httpx is not None:
+            chat_response, capabilities_response = asyncio.run(self._run_concurrent_probes())
+        
         # Test 4: Test chat
-        results['chat'] = self.test_chat()
+        results['chat'] = self.test_chat(chat_response)
         
         # Test 5: Test agent capabilities
-        results['agent_capabilities'] = self.test_agent_capabilities()
+        results['agent_capabilities'] = self.test_agent_capabilities(capabilities_response)
         
         # Test 6: Test APK file
         results['apk_file'] = self.test_apk_file()
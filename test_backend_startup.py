@@ -4,13 +4,18 @@ Test script to start and test Nova AI Tutor backend
 Run this script manually: python3 test_backend_startup.py
 """
 
+import asyncio
 import subprocess
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import re
 import signal
 import sys
+import tempfile
 
 def run_command(cmd, description):
     """Run a shell command and return the result"""
@@ -31,39 +36,17 @@ def run_command(cmd, description):
         print(f"Error running command: {e}")
         return None
 
-def test_backend():
-    print("=== Nova AI Tutor Backend Startup Test ===")
-    
-    # 1. Check for existing uvicorn processes
-    run_command("ps aux | grep uvicorn", "1. Checking for existing uvicorn processes")
-    
-    # 2. Kill any existing uvicorn processes
-    run_command("pkill -f uvicorn", "2. Killing any existing uvicorn processes")
-    time.sleep(2)
-    
-    # 3. Start uvicorn server
-    print("\n3. Starting uvicorn server...")
-    backend_dir = "/home/jd/AI_Tutor/backend"
-    os.chdir(backend_dir)
-    
-    # Start uvicorn in background
-    uvicorn_process = subprocess.Popen([
-        "uvicorn", "main:app", "--reload", "--port", "9000"
-    ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    
-    print(f"Started uvicorn with PID: {uvicorn_process.pid}")
-    
-    # Wait for server to start
-    print("Waiting 5 seconds for server to start...")
-    time.sleep(5)
-    
-    # 4. Test if backend is responding
-    print("\n4. Testing backend endpoints...")
+def probe_endpoints():
+    """Probe the docs and signup endpoints of the running server"""
+    # One keep-alive connection for every call; retry connection flakes
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                         max_retries=Retry(total=2, backoff_factor=0.2)))
     
     try:
         # Test docs endpoint
         print("Testing /docs endpoint...")
-        response = requests.get("http://localhost:9000/docs", timeout=5)
+        response = session.get("http://localhost:9000/docs", timeout=5)
         print(f"Docs endpoint status: {response.status_code}")
         if response.status_code == 200:
             print("✓ Docs endpoint is working!")
@@ -83,7 +66,7 @@ def test_backend():
             "password": "password123"
         }
         
-        response = requests.post(
+        response = session.post(
             "http://localhost:9000/api/auth/signup",
             headers={"Content-Type": "application/json"},
             json=signup_data,
@@ -103,23 +86,79 @@ def test_backend():
             
     except requests.exceptions.RequestException as e:
         print(f"✗ Failed to connect to signup endpoint: {e}")
+
+# uvicorn logs this line once the app is ready to serve
+STARTUP_COMPLETE = re.compile(rb"Application startup complete")
+SERVER_LOG = os.path.join(tempfile.gettempdir(), "nova_uvicorn.log")
+
+async def _wait_for_startup(proc, log_path=SERVER_LOG, pattern=STARTUP_COMPLETE, timeout=8.0):
+    """Poll the server log until pattern appears; False if the server exits or time runs out"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while proc.returncode is None and loop.time() < deadline:
+        with open(log_path, "rb") as log:
+            if pattern.search(log.read()):
+                return True
+        await asyncio.sleep(0.1)
+    return False
+
+async def _stop_server(proc, timeout=5.0):
+    """Terminate the server and reap it, killing it if it ignores SIGTERM"""
+    if proc.returncode is None:
+        proc.terminate()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+    await proc.wait()
+
+async def test_backend():
+    print("=== Nova AI Tutor Backend Startup Test ===")
+    
+    # 1. Check for existing uvicorn processes
+    run_command("ps aux | grep uvicorn", "1. Checking for existing uvicorn processes")
     
-    # 5. Check if process is still running
-    print("\n5. Checking if uvicorn process is still running...")
-    run_command("ps aux | grep uvicorn", "Current uvicorn processes")
+    # 2. Kill any existing uvicorn processes
+    run_command("pkill -f uvicorn", "2. Killing any existing uvicorn processes")
+    time.sleep(2)
     
-    # Keep server running or kill it
-    print(f"\nUvicorn server is running with PID: {uvicorn_process.pid}")
-    print("Server will continue running in background.")
-    print("To stop it later, run: kill", uvicorn_process.pid)
-    print("Or use: pkill -f uvicorn")
+    # 3. Start uvicorn server
+    print("\n3. Starting uvicorn server...")
+    backend_dir = "/home/jd/AI_Tutor/backend"
+    os.chdir(backend_dir)
+    
+    # Start uvicorn, logging to a file so a full pipe can never block it
+    with open(SERVER_LOG, "wb") as log:
+        uvicorn_process = await asyncio.create_subprocess_exec(
+            "uvicorn", "main:app", "--reload", "--port", "9000",
+            stdout=log, stderr=asyncio.subprocess.STDOUT
+        )
+    
+    try:
+        print(f"Started uvicorn with PID: {uvicorn_process.pid} (log: {SERVER_LOG})")
+        
+        # Wait for uvicorn to log that startup is complete
+        print("Waiting for server to start...")
+        if not await _wait_for_startup(uvicorn_process):
+            print("Server did not report startup complete within 8 seconds")
+        
+        # 4. Test if backend is responding
+        print("\n4. Testing backend endpoints...")
+        await asyncio.to_thread(probe_endpoints)
+        
+        # 5. Check if process is still running
+        print("\n5. Checking if uvicorn process is still running...")
+        await asyncio.to_thread(run_command, "ps aux | grep uvicorn", "Current uvicorn processes")
+    finally:
+        print(f"\nStopping uvicorn server (PID: {uvicorn_process.pid})...")
+        await _stop_server(uvicorn_process)
     
     return uvicorn_process.pid
 
 if __name__ == "__main__":
     try:
-        pid = test_backend()
-        print(f"\n=== Backend test completed. Server PID: {pid} ===")
+        pid = asyncio.run(test_backend())
+        print(f"\n=== Backend test completed. Server PID was: {pid} ===")
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
     except Exception as e:
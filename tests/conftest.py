@@ -0,0 +1,48 @@
+"""Shared pytest configuration for the integration tests"""
+
+from pathlib import Path
+
+import pytest
+
+try:
+    import yappi
+except ImportError:
+    yappi = None
+
+PROFILE_DIR = Path("prof")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--integration",
+        action="store_true",
+        default=False,
+        help="call the real AI providers and media generators instead of deterministic stubs"
+    )
+    parser.addoption(
+        "--profile-async",
+        action="store_true",
+        default=False,
+        help="profile each test with yappi (wall clock, await-aware) into prof/<test>.pstat; "
+             "render with e.g. `flameprof prof/<test>.pstat > <test>.svg`"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _async_profile(request):
+    """Wall-clock yappi profile per test; unlike cProfile it attributes time across awaits"""
+    if not request.config.getoption("--profile-async"):
+        yield
+        return
+    if yappi is None:
+        pytest.skip("--profile-async requires yappi")
+
+    yappi.clear_stats()
+    yappi.set_clock_type("wall")
+    yappi.start()
+    try:
+        yield
+    finally:
+        yappi.stop()
+        PROFILE_DIR.mkdir(exist_ok=True)
+        yappi.get_func_stats().save(str(PROFILE_DIR / f"{request.node.name}.pstat"), type="pstat")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+A/B Testing Engine Tests
+Batch event ingestion against the per-event path
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from optimization import ab_testing_engine
+from optimization.ab_testing_engine import ABTestEngine
+
+# Event types in event-code order (the rows of ABTest._counters)
+EVENT_TYPES = list(ab_testing_engine._EVENT_DISPATCH)
+
+
+def _running_test(engine, variant_count=3):
+    """Create and start a test whose minimum sample is far above the events recorded here"""
+    now = datetime.now()
+    test_config = {
+        "name": "Batch ingestion",
+        "description": "record_events vs record_event",
+        "test_type": "content_hook",
+        "primary_metric": "conversion_rate",
+        "variants": [
+            {"name": f"Variant {i}", "description": f"Variant {i}", "data": {}}
+            for i in range(variant_count)
+        ],
+        "baseline_rate": 0.05,
+        "minimum_effect_size": 0.1,
+        "start_date": now.isoformat(),
+        "end_date": (now + timedelta(days=14)).isoformat()
+    }
+
+    async def create():
+        test = await engine.create_test(test_config)
+        assert await engine.start_test(test.test_id)
+        return test
+
+    return asyncio.run(create())
+
+
+def test_record_events_matches_record_event():
+    rng = np.random.default_rng(7)
+    size = 500
+    variant_indices = rng.integers(0, 3, size)
+    event_codes = rng.integers(0, len(EVENT_TYPES), size)
+    revenue = np.where(rng.random(size) < 0.5, rng.gamma(2.0, 20.0, size), np.nan)
+
+    single_engine, batch_engine = ABTestEngine(), ABTestEngine()
+    single, batch = _running_test(single_engine), _running_test(batch_engine)
+
+    for idx, code, amount in zip(variant_indices.tolist(), event_codes.tolist(), revenue.tolist()):
+        event_data = None if np.isnan(amount) else {"revenue": amount}
+        single_engine.record_event(single.test_id, single.variants[idx].variant_id, EVENT_TYPES[code], event_data)
+
+    batch_engine.record_events(batch.test_id, variant_indices, event_codes, revenue)
+
+    assert single.status == batch.status == ab_testing_engine.TestStatus.RUNNING
+    np.testing.assert_array_equal(batch._counters, single._counters)
+    np.testing.assert_array_equal(batch._rev_n, single._rev_n)
+    np.testing.assert_allclose(batch._rev, single._rev)
+    np.testing.assert_allclose(batch._rev_mean, single._rev_mean)
+    np.testing.assert_allclose(batch._rev_m2, single._rev_m2)
+    assert batch._total_impressions == single._total_impressions
+    assert batch._event_seq == single._event_seq
+    assert [v.impressions for v in batch.variants] == [v.impressions for v in single.variants]
+
+
+@pytest.mark.parametrize("variant_indices, event_codes, revenue", [
+    ([0, -1], [0, 0], None),
+    ([0, 3], [0, 0], None),
+    ([0, 1], [0, 3], None),
+    ([0, 1], [-1, 0], None),
+    ([0, 1], [0], None),
+    ([0, 1], [2, 2], [10.0]),
+])
+def test_record_events_rejects_invalid_batches(variant_indices, event_codes, revenue):
+    engine = ABTestEngine()
+    test = _running_test(engine)
+
+    with pytest.raises(ValueError):
+        engine.record_events(test.test_id, variant_indices, event_codes, revenue)
+
+    assert not test._counters.any()
+    assert test._event_seq == 0
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Monetization Scoring Tests
+Batch opportunity scoring against the per-profile scalar path
+"""
+
+import asyncio
+from itertools import product
+
+from revenue.advanced_monetization_engine import (
+    RevenueIntelligenceEngine, _COURSE_BASE_PRICES, _NICHES, _opp_to_dict
+)
+
+# Both sides of every threshold: 10k/50k followers, 5% engagement (also where
+# the sponsored engagement multiplier leaves 1.0) and the $10k sponsored cap
+FOLLOWERS = (0, 9999, 10000, 49999, 50000, 999999, 1000001, 5000000)
+ENGAGEMENT = (0.0, 0.01, 0.05, 0.0500001, 0.12)
+NICHES = _NICHES + ("unlisted",)
+EXPERTISE = tuple(_COURSE_BASE_PRICES) + ("unlisted",)
+MONTHLY_VIEWS = (0, 123457)
+
+
+def _without_id(opportunity):
+    result = _opp_to_dict(opportunity)
+    del result["opportunity_id"]
+    return result
+
+
+def test_batch_scoring_matches_scalar_path():
+    engine = RevenueIntelligenceEngine()
+    profiles = [
+        {
+            "total_followers": followers,
+            "engagement_rate": engagement,
+            "niche": niche,
+            "expertise_level": expertise,
+            "monthly_views": views
+        }
+        for followers, engagement, niche, expertise, views
+        in product(FOLLOWERS, ENGAGEMENT, NICHES, EXPERTISE, MONTHLY_VIEWS)
+    ]
+
+    async def scalar_results():
+        return [await engine.analyze_revenue_opportunities(profile) for profile in profiles]
+
+    batch = engine.analyze_revenue_opportunities_batch(profiles)
+    scalar = asyncio.run(scalar_results())
+
+    assert len(batch) == len(scalar) == len(profiles)
+    for profile, batch_opps, scalar_opps in zip(profiles, batch, scalar):
+        assert [_without_id(o) for o in batch_opps] == [_without_id(o) for o in scalar_opps], profile
@@ -4,8 +4,10 @@ This FastAPI application handles incoming SMS and voice webhooks from Twilio.
 """
 
 import logging
+import os
+
 from fastapi import FastAPI, Form, Request
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import Response
 from twilio.twiml.messaging_response import MessagingResponse
 from twilio.twiml.voice_response import VoiceResponse
 
@@ -16,9 +18,29 @@ import aura_agent
 app = FastAPI()
 logger = logging.getLogger("uvicorn")
 
+def _build_voice_twiml() -> str:
+    resp = VoiceResponse()
+    resp.say(
+        "Hello, this is AURA. This line is for text messages only. Goodbye!",
+        voice="polly.Joanna",
+    )
+    resp.hangup()
+    return str(resp)
+
+
+def _sms_twiml(text: str) -> bytes:
+    resp = MessagingResponse()
+    resp.message(text)
+    return str(resp).encode("utf-8")
+
+
+# The voice reply never changes, so it is rendered and encoded once at import
+_VOICE_TWIML: str = _build_voice_twiml()
+_VOICE_TWIML_BYTES: bytes = _VOICE_TWIML.encode("utf-8")
+
 # --- Webhook Endpoints ---
 
-@app.post("/sms", response_class=PlainTextResponse)
+@app.post("/sms", response_class=Response)
 async def sms_reply(
     request: Request,
     From: str = Form(...),
@@ -31,31 +53,30 @@ async def sms_reply(
     logger.info(f"Incoming SMS from {From}: {Body}")
 
     # Get a response from the AURA agent
-    response_text = aura_agent.get_aura_response(Body, engine="gpt")
-
-    # Create a TwiML response
-    resp = MessagingResponse()
-    resp.message(response_text)
+    response_text = await aura_agent.get_aura_response(Body, user_id=From, engine="gpt")
 
-    return str(resp)
+    # Reply with pre-encoded TwiML
+    return Response(content=_sms_twiml(response_text), media_type="application/xml")
 
 
-@app.post("/voice", response_class=PlainTextResponse)
+@app.post("/voice", response_class=Response)
 async def voice_reply():
     """
     Handles incoming voice calls.
     Responds with a message indicating that the line is for text messages only.
     """
-    resp = VoiceResponse()
-    resp.say(
-        "Hello, this is AURA. This line is for text messages only. Goodbye!",
-        voice="polly.Joanna",
-    )
-    resp.hangup()
-    return str(resp)
+    return Response(content=_VOICE_TWIML_BYTES, media_type="application/xml")
 
 # --- Main Entry Point ---
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
+    # One worker per core, leaving one free for the OS
+    uvicorn.run(
+        "twilio_webhooks:app",
+        host="0.0.0.0",
+        port=8080,
+        loop="uvloop",
+        http="httptools",
+        workers=max(1, (os.cpu_count() or 2) - 1),
+    )
\ No newline at end of file